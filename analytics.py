@@ -0,0 +1,235 @@
+import threading
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+
+from constants import COUNTIES, DIVISIONS, SPECIES_OPTIONS, WEIGH_IN_LOCATIONS
+
+WEIGHT_BIN_LBS = 5
+WEIGHT_BINS = 21  # the last bin collects 100+ lbs
+UNKNOWN = "Unknown"
+EPOCH = date(1970, 1, 1)
+
+
+class _Column:
+    """Append-only NumPy array with amortised O(1) growth."""
+
+    def __init__(self, dtype, capacity=1024):
+        self.data = np.zeros(capacity, dtype=dtype)
+        self.size = 0
+
+    def extend(self, values):
+        end = self.size + len(values)
+        if end > len(self.data):
+            grown = np.zeros(max(end, 2 * len(self.data)), dtype=self.data.dtype)
+            grown[:self.size] = self.data[:self.size]
+            self.data = grown
+        self.data[self.size:end] = values
+        self.size = end
+
+    def view(self):
+        return self.data[:self.size]
+
+
+def _codes(values, categories):
+    # Unknown values map to the extra last code
+    codes = pd.Categorical(values, categories=categories).codes.astype(np.int64)
+    codes[codes < 0] = len(categories)
+    return codes
+
+
+def _day_numbers(dates):
+    return pd.to_datetime(pd.Series(dates)).values.astype("datetime64[D]").astype(np.int64)
+
+
+class SeasonAnalytics:
+    """Columnar catch data plus daily rollups for the season dashboard.
+
+    Species, weigh-in location, division and county are stored as integer
+    codes. Each accepted catch adds one to a handful of per-day count
+    arrays, so dashboard queries sum a day range of small arrays instead
+    of scanning catches.
+    """
+
+    def __init__(self, species=SPECIES_OPTIONS, locations=WEIGH_IN_LOCATIONS,
+                 divisions=DIVISIONS, counties=COUNTIES):
+        self.species = list(species)
+        self.locations = list(locations)
+        self.divisions = list(divisions)
+        self.counties = list(counties)
+        self.captain_names = []
+        self._captain_codes = {}
+        self._index = {
+            'species': {name: i for i, name in enumerate(self.species)},
+            'location': {name: i for i, name in enumerate(self.locations)},
+            'division': {name: i for i, name in enumerate(self.divisions)},
+            'county': {name: i for i, name in enumerate(self.counties)},
+        }
+        self._lock = threading.RLock()
+        self._columns = {
+            'id': _Column(np.int64),
+            'day': _Column(np.int32),
+            'species': _Column(np.int8),
+            'location': _Column(np.int16),
+            'division': _Column(np.int8),
+            'county': _Column(np.int8),
+            'captain': _Column(np.int32),
+            'weight': _Column(np.float32),
+            'valid': _Column(np.bool_),
+        }
+        self._base_day = None
+        self._last_day = None
+        self._days = 0
+        self._species_location = np.zeros((0, len(self.species) + 1, len(self.locations) + 1), np.int32)
+        self._division_weight = np.zeros((0, len(self.divisions) + 1, WEIGHT_BINS), np.int32)
+        self._county = np.zeros((0, len(self.counties) + 1), np.int32)
+        self._captain_counts = _Column(np.int32)
+
+    @classmethod
+    def from_store(cls, store, counties=None):
+        analytics = cls()
+        for rows in store.iter_chunks(50000):
+            analytics.add_frame(pd.DataFrame.from_records(rows, columns=rows[0].keys()), counties)
+        return analytics
+
+    def __len__(self):
+        return int(self._columns['valid'].view().sum())
+
+    def _captain_code_array(self, names):
+        codes = np.empty(len(names), dtype=np.int64)
+        for i, name in enumerate(names):
+            code = self._captain_codes.get(name)
+            if code is None:
+                code = self._captain_codes[name] = len(self.captain_names)
+                self.captain_names.append(name)
+                self._captain_counts.extend([0])
+            codes[i] = code
+        return codes
+
+    def _cover_days(self, days):
+        # Grow the per-day rollups so every day in `days` has a row
+        low, high = int(days.min()), int(days.max())
+        if self._base_day is None:
+            self._base_day = self._last_day = low
+        self._last_day = max(self._last_day, high)
+        front = max(0, self._base_day - low)
+        back = max(0, high + 1 - (self._base_day + self._days))
+        if back:
+            # Over-allocate at the end so a season grows in O(log days) steps
+            back = max(back, self._days // 2)
+        if front or back:
+            pad = ((front, back), (0, 0), (0, 0))
+            self._species_location = np.pad(self._species_location, pad)
+            self._division_weight = np.pad(self._division_weight, pad)
+            self._county = np.pad(self._county, pad[:2])
+            self._base_day -= front
+            self._days += front + back
+
+    def _apply(self, rows, sign):
+        day = rows['day'] - self._base_day
+        bins = np.minimum((rows['weight'] // WEIGHT_BIN_LBS).astype(np.int64), WEIGHT_BINS - 1)
+        np.add.at(self._species_location, (day, rows['species'], rows['location']), sign)
+        np.add.at(self._division_weight, (day, rows['division'], bins), sign)
+        np.add.at(self._county, (day, rows['county']), sign)
+        np.add.at(self._captain_counts.data, rows['captain'], sign)
+
+    def add_frame(self, df, counties=None):
+        """Add a DataFrame of catches (store columns); counties maps captain -> county."""
+        if df.empty:
+            return
+        counties = counties or {}
+        with self._lock:
+            disqualified = df['disqualified'] if 'disqualified' in df else pd.Series(0, index=df.index)
+            self._append({
+                'id': df['id'].to_numpy(np.int64),
+                'day': _day_numbers(df['date']),
+                'species': _codes(df['species'], self.species),
+                'location': _codes(df['weigh_in'], self.locations),
+                'division': _codes(df['division'], self.divisions),
+                'county': _codes(df['captain'].map(counties), self.counties),
+                'captain': self._captain_code_array(df['captain'].tolist()),
+                'weight': df['weight'].to_numpy(np.float32),
+                'valid': ~disqualified.astype(bool).to_numpy(),
+            })
+
+    def add(self, catch, county=None):
+        """Add one accepted catch without going through pandas."""
+        def code(field, value):
+            return np.array([self._index[field].get(value, len(self._index[field]))])
+
+        with self._lock:
+            self._append({
+                'id': np.array([catch['id']]),
+                'day': np.array([(date.fromisoformat(catch['date']) - EPOCH).days]),
+                'species': code('species', catch['species']),
+                'location': code('location', catch['weigh_in']),
+                'division': code('division', catch['division']),
+                'county': code('county', county),
+                'captain': self._captain_code_array([catch['captain']]),
+                'weight': np.array([catch['weight']], dtype=np.float32),
+                'valid': np.array([not catch.get('disqualified')]),
+            })
+
+    def _append(self, rows):
+        for name, column in self._columns.items():
+            column.extend(rows[name])
+        valid = rows['valid']
+        if valid.any():
+            self._cover_days(rows['day'][valid])
+            self._apply({k: v[valid] for k, v in rows.items()}, 1)
+
+    def remove(self, catch_id):
+        """Back a disqualified catch out of the rollups."""
+        with self._lock:
+            ids = self._columns['id'].view()
+            i = int(np.searchsorted(ids, catch_id))
+            if i == len(ids) or ids[i] != catch_id or not self._columns['valid'].data[i]:
+                return False
+            self._columns['valid'].data[i] = False
+            self._apply({name: column.data[i:i + 1] for name, column in self._columns.items()}, -1)
+            return True
+
+    def _day_slice(self, start=None, end=None):
+        if self._base_day is None:
+            return slice(0, 0)
+        lo = 0 if start is None else max(0, (start - EPOCH).days - self._base_day)
+        last = self._last_day if end is None else (end - EPOCH).days
+        hi = max(lo, last - self._base_day + 1)
+        return slice(lo, min(hi, self._days))
+
+    def species_by_location(self, start=None, end=None):
+        with self._lock:
+            counts = self._species_location[self._day_slice(start, end)].sum(axis=0)
+        df = pd.DataFrame(counts.T, index=self.locations + [UNKNOWN], columns=self.species + [UNKNOWN])
+        return df.loc[df.sum(axis=1) > 0, df.sum(axis=0) > 0]
+
+    def weight_distribution(self, start=None, end=None):
+        with self._lock:
+            counts = self._division_weight[self._day_slice(start, end)].sum(axis=0)
+        labels = [f"{i * WEIGHT_BIN_LBS}-{(i + 1) * WEIGHT_BIN_LBS}" for i in range(WEIGHT_BINS - 1)]
+        labels.append(f"{(WEIGHT_BINS - 1) * WEIGHT_BIN_LBS}+")
+        df = pd.DataFrame(counts.T, index=labels, columns=self.divisions + [UNKNOWN])
+        return df.loc[:, df.sum(axis=0) > 0]
+
+    def daily_volume(self, start=None, end=None):
+        with self._lock:
+            days = self._day_slice(start, end)
+            counts = self._county[days].sum(axis=1)
+            first = EPOCH + timedelta(days=(self._base_day or 0) + days.start)
+        return pd.Series(counts, index=pd.date_range(first, periods=len(counts), freq="D"), name="catches")
+
+    def county_activity(self, start=None, end=None):
+        with self._lock:
+            counts = self._county[self._day_slice(start, end)].sum(axis=0)
+        return pd.Series(counts, index=self.counties + [UNKNOWN], name="catches")
+
+    def captain_activity(self, n=10):
+        """Season catch counts of the n most active captains."""
+        with self._lock:
+            counts = self._captain_counts.view().copy()
+        if not len(counts):
+            return pd.Series(dtype=np.int32, name="catches")
+        top = np.argpartition(-counts, min(n, len(counts)) - 1)[:n]
+        top = top[np.argsort(-counts[top], kind="stable")]
+        return pd.Series(counts[top], index=[self.captain_names[i] for i in top], name="catches")
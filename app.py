@@ -1,84 +1,125 @@
+import atexit
+import io
+import os
+import tempfile
 import streamlit as st
 import pandas as pd
-from datetime import datetime
-from PIL import Image, ExifTags
-
-# In-memory storage
-if 'users' not in st.session_state:
-    st.session_state.users = {}
-if 'events' not in st.session_state:
-    st.session_state.events = {
-        "Everyday Angler Charter Tournament": {
-            'description': 'Year-long charter tournament in Palm Beach, Broward, and Miami-Dade counties. Pelagic and Reef divisions.',
-            'start': 'February 1, 2026',
-            'end': 'November 30, 2026',
-            'registered_users': []
-        }
-    }
+from datetime import date, datetime
+
+import bulk_data
+from analytics import SeasonAnalytics
+from auth import CONFIRM_TOKEN_SECONDS, Auth, AuthBusy, RateLimited
+from catch_store import CatchStore
+from constants import COUNTIES, DIVISIONS, MAX_WEIGHT_LBS, SPECIES_OPTIONS, WEIGH_IN_LOCATIONS
+from event_engine import CatchRejected, EventEngine
+from image_normalize import ImageError, normalize_image
+from leaderboard import Leaderboard
+from media_derivatives import DerivativeCache, MediaDerivatives
+from media_fingerprint import VideoFingerprints
+from media_ingest import BlobStore, VideoIngestor
+from profiling import Metrics, finish_profile, start_profile
+from shared_state import SharedState
+from user_repository import DIRECTORY_PAGE_SIZE, UserRepository
+
+DATA_DIR = os.environ.get("ANGLER_DATA_DIR", "data")
+FEED_SIZE = 25
+FEED_REFRESH_SECONDS = 5
+# Usernames that review suspected video reuse, comma separated
+STAFF_USERS = {name.strip() for name in os.environ.get("ANGLER_STAFF", "").split(",") if name.strip()}
+VIDEO_FIELDS = {'landing_video': "Landing", 'weighin_video': "Weigh-in"}
+
+# Catches persist on disk and are shared by every session
+@st.cache_resource
+def get_catch_store():
+    return CatchStore(os.path.join(DATA_DIR, "catches.db"))
+
+# Standings are rebuilt from the store once per process, then kept up to date
+# as catches are accepted or disqualified
+@st.cache_resource
+def get_leaderboard():
+    return Leaderboard.from_catches(get_catch_store().iter_catches())
+
+# Uploaded videos and pictures are stored once per content hash
+@st.cache_resource
+def get_blob_store():
+    return BlobStore(os.path.join(DATA_DIR, "blobs"))
+
+@st.cache_resource
+def get_video_ingestor():
+    return VideoIngestor(get_blob_store())
+
+# Thumbnails and video posters, generated off the script thread
+@st.cache_resource
+def get_media_derivatives():
+    cache = DerivativeCache(os.path.join(DATA_DIR, "derivatives"))
+    # Cache hits only reorder an in-memory list; save it as mtimes on exit
+    atexit.register(cache.flush)
+    return MediaDerivatives(cache)
+
+# Season-wide index of catch video fingerprints, for spotting reused footage
+@st.cache_resource
+def get_video_fingerprints():
+    return VideoFingerprints(os.path.join(DATA_DIR, "fingerprints.jsonl"))
+
+# Tournaments with daily windows, wristband colors and check-ins. The
+# colors are keyed on ANGLER_SECRET_KEY so they can't be guessed ahead
+@st.cache_resource
+def get_event_engine():
+    engine = EventEngine(os.environ.get("ANGLER_SECRET_KEY", "").encode())
+    engine.add_event(
+        "Everyday Angler Charter Tournament",
+        'Year-long charter tournament in Palm Beach, Broward, and Miami-Dade counties. Pelagic and Reef divisions.',
+        start=date(2026, 2, 1),
+        end=date(2026, 11, 30),
+    )
+    return engine
+
+# Rerun timings for every session; set ANGLER_METRICS_LOG to also append
+# each rerun's spans to a JSON-lines file
+@st.cache_resource
+def get_metrics():
+    return Metrics(os.environ.get("ANGLER_METRICS_LOG"))
+
+# Users, events and catches are shared by every session in the process
+@st.cache_resource
+def get_shared_state():
+    return SharedState(
+        users=UserRepository(),
+        catch_store=get_catch_store(),
+        leaderboard=get_leaderboard(),
+        events=get_event_engine(),
+        analytics=SeasonAnalytics.from_store(get_catch_store()),
+    )
+
+# Password hashing pool and token signing key; set ANGLER_SECRET_KEY so
+# tokens survive restarts
+@st.cache_resource
+def get_auth():
+    secret_key = os.environ.get("ANGLER_SECRET_KEY")
+    return Auth(secret_key.encode() if secret_key else None)
+
+shared = get_shared_state()
+auth = get_auth()
+catch_store = shared.catch_store
+leaderboard = shared.leaderboard
+blob_store = get_blob_store()
+video_ingestor = get_video_ingestor()
+media = get_media_derivatives()
+fingerprints = get_video_fingerprints()
+metrics = get_metrics()
+
+metrics.begin_rerun()
+# A profiler left running by a rerun that st.rerun() cut short is dropped
+if stale_profiler := st.session_state.pop('profiler', None):
+    stale_profiler.disable()
+if st.session_state.pop('profile_next_rerun', False):
+    st.session_state.profiler = start_profile()
+
+# Session-local state
 if 'user_events' not in st.session_state:
     st.session_state.user_events = {}
-if 'daily_anglers' not in st.session_state:
-    st.session_state.daily_anglers = []
-if 'catches' not in st.session_state:
-    st.session_state.catches = []
 if 'pending_catches' not in st.session_state:
     st.session_state.pending_catches = {}
-if 'wristband_color' not in st.session_state:
-    st.session_state.wristband_color = {"Everyday Angler Charter Tournament": "Red"}
-
-# Counties
-COUNTIES = ["Palm Beach", "Broward", "Miami-Dade"]
-
-# Weigh-in locations (full list)
-WEIGH_IN_LOCATIONS = [
-    "Sailfish Marina Resort (Singer Island)",
-    "Riviera Beach Marina Village",
-    "Boynton Harbor Marina",
-    "Palm Beach Yacht Center (Lantana)",
-    "Two Georges Waterfront Grille (Boynton Beach)",
-    "Banana Boat (Boynton Beach)",
-    "Old Key Lime House (Lantana)",
-    "Frigate’s Waterfront Bar & Grill (North Palm Beach)",
-    "Prime Catch (Boynton Beach)",
-    "Waterway Cafe (Palm Beach Gardens)",
-    "Seasons 52 (Palm Beach Gardens)",
-    "The River House (Palm Beach Gardens)",
-    "Sands Harbor Resort & Marina (Pompano Beach)",
-    "PORT 32 Lighthouse Point Marina",
-    "Taha Marine Center (Pompano Beach)",
-    "The Cove Marina / Two Georges at the Cove (Deerfield Beach)",
-    "Shooters Waterfront (Fort Lauderdale)",
-    "Boatyard (Fort Lauderdale)",
-    "Coconuts (Fort Lauderdale)",
-    "Rustic Inn Crabhouse (Fort Lauderdale)",
-    "15th Street Fisheries (Fort Lauderdale)",
-    "Southport Raw Bar (Fort Lauderdale)",
-    "Kaluz Restaurant (Fort Lauderdale)",
-    "Boathouse at the Riverside (Fort Lauderdale)",
-    "Homestead Bayfront Marina",
-    "Black Point Marina (Cutler Bay)",
-    "Haulover Marine Center / Bill Bird Marina",
-    "Crandon Park Marina (Key Biscayne)",
-    "Matheson Hammock Marina (Coral Gables)",
-    "Dinner Key Marina (Coconut Grove)",
-    "Rusty Pelican (Key Biscayne)",
-    "Monty's Raw Bar (Coconut Grove)",
-    "Shuckers Waterfront Bar & Grill (North Bay Village)",
-    "Garcia's Seafood Grille & Fish Market (Miami River)",
-    "Boater's Grill (Key Biscayne)",
-    "American Social (Brickell)",
-    "Billy's Stone Crab Restaurant (Hollywood)",
-    "Seaspice Brasserie & Lounge (Miami River)"
-]
-
-SPECIES_OPTIONS = [
-    "King Mackerel",
-    "Spanish Mackerel",
-    "Wahoo",
-    "Dolphin/Mahi Mahi",
-    "Black Fin Tuna",
-    "Other - Captain's Choice Award Entry"
-]
 
 # Simple login/register
 if 'logged_user' not in st.session_state:
@@ -89,11 +130,16 @@ def register(username, password, confirm_password, role):
     if password != confirm_password:
         st.error("Passwords do not match")
         return False
-    if username in st.session_state.users:
+    if username in shared.users:
         st.error("Username taken")
         return False
-    st.session_state.users[username] = {
-        'password': password,
+    try:
+        password_hash = auth.hash_password(password)
+    except AuthBusy as e:
+        st.error(str(e))
+        return False
+    if not shared.register_user(username, {
+        'password': password_hash,
         'role': role,
         'active': True,
         'picture': None,
@@ -109,42 +155,349 @@ def register(username, password, confirm_password, role):
         'county': "",
         'state': "",
         'events': []
-    }
-    if role == "Angler/Team":
-        if username not in st.session_state.daily_anglers:
-            st.session_state.daily_anglers.append(username)
+    }):
+        st.error("Username taken")
+        return False
     return True
 
+# Fields the My Profile tab edits and Save Profile writes back
+PROFILE_FIELDS = ('phone', 'email', 'website', 'instagram', 'facebook', 'tiktok', 'youtube', 'x', 'bio', 'county', 'state')
+
+def start_session(username, role, user_data):
+    st.session_state.logged_user = username
+    st.session_state.role = role
+    # The profile tab edits this copy; the shared profile changes on save
+    st.session_state.user_data = {k: v for k, v in user_data.items() if k != 'password'}
+    st.session_state.auth_token = auth.issue_token(username)
+    st.session_state.confirm_token = None
+
+def end_session():
+    st.session_state.logged_user = None
+    st.session_state.role = None
+    st.session_state.auth_token = None
+    st.session_state.confirm_token = None
+
 def login(username, password):
-    user = st.session_state.users.get(username)
-    if user and user['password'] == password:
-        st.session_state.logged_user = username
-        st.session_state.role = user['role']
-        st.session_state.user_data = user
+    user = shared.users.get(username)
+    # Unknown usernames still cost a hash, so timing doesn't reveal which exist
+    if auth.check_password(username, password, user and user['password']) and user:
+        start_session(username, user['role'], user)
         return True
     return False
 
-# Fix image orientation
-def fix_image_orientation(uploaded_file):
-    if uploaded_file is None:
+# Quick test logins share the password "test"; None, or why it failed
+def register_test_user(username):
+    if username in shared.users:
         return None
-    image = Image.open(uploaded_file)
     try:
-        for orientation in ExifTags.TAGS.keys():
-            if ExifTags.TAGS[orientation] == 'Orientation':
-                break
-        exif = image._getexif()
-        if exif is not None:
-            if orientation in exif:
-                if exif[orientation] == 3:
-                    image = image.rotate(180, expand=True)
-                elif exif[orientation] == 6:
-                    image = image.rotate(270, expand=True)
-                elif exif[orientation] == 8:
-                    image = image.rotate(90, expand=True)
-    except:
-        pass
-    return image
+        shared.register_user(username, {'password': auth.hash_password("test")})
+    except AuthBusy as e:
+        return str(e)
+    return None
+
+# Re-entering the password before a catch is checked once, then a
+# short-lived confirm token covers the next submissions
+def confirm_catch_password(password):
+    username = st.session_state.logged_user
+    stored = shared.users.get(username, {}).get('password')
+    try:
+        if not auth.check_password(username, password, stored):
+            return "Password incorrect"
+    except (AuthBusy, RateLimited) as e:
+        return str(e)
+    st.session_state.confirm_token = auth.issue_token(username, "confirm", CONFIRM_TOKEN_SECONDS)
+    return None
+
+def catch_label(catch):
+    label = f"{catch['angler']} – {catch['weight']:.2f} lbs – {catch['species']} – {catch['date']}"
+    if catch['disqualified']:
+        label += " – Disqualified"
+    return label
+
+# Live Catch Feed pages sit below the session's anchor id, so new catches
+# never change them; they are keyed on the corrections version instead
+@st.cache_data(max_entries=256)
+def load_feed_page(_store, before_id, corrections_version):
+    return _store.page(before_id, FEED_SIZE)
+
+def render_catch_video(blob_id, label):
+    if blob_id == "Missing":
+        st.info(f"{label} video missing")
+    elif blob_store.exists(blob_id):
+        st.video(blob_store.path(blob_id))
+    else:
+        st.video(f"https://via.placeholder.com/150?text={label}+Video")
+
+def render_catch_posters(catch):
+    posters = [media.poster(catch[video]) for video in ('landing_video', 'weighin_video') if catch[video] != "Missing"]
+    posters = [poster for poster in posters if poster]
+    if posters:
+        st.image(posters, width=160)
+
+# Small cached variant when ready, the stored original until then
+def profile_picture(blob_id, size):
+    return media.profile_picture(blob_id, size) or blob_store.path(blob_id)
+
+def render_catch(catch):
+    with st.expander(catch_label(catch)):
+        st.write(f"Captain: {catch['captain']} | Weigh-In: {catch['weigh_in']}")
+        render_catch_posters(catch)
+        # Videos are only sent once the viewer asks for them
+        if st.toggle("Show videos", key=f"videos_{catch['id']}"):
+            colv1, colv2 = st.columns(2)
+            with colv1:
+                render_catch_video(catch['landing_video'], "Landing")
+            with colv2:
+                render_catch_video(catch['weighin_video'], "Weigh-in")
+
+def init_feed_state():
+    if 'feed_anchor_id' not in st.session_state:
+        st.session_state.feed_anchor_id = catch_store.latest_id()
+        st.session_state.feed_last_seen_id = st.session_state.feed_anchor_id
+        st.session_state.feed_new_count = 0
+        st.session_state.feed_pages = 1
+
+def reanchor_feed():
+    st.session_state.feed_anchor_id = st.session_state.feed_last_seen_id
+    st.session_state.feed_new_count = 0
+    st.session_state.feed_pages = 1
+
+def load_older_catches():
+    st.session_state.feed_pages += 1
+
+# Polls the in-process catches topic and only counts what arrived, so a
+# tick with nothing new is one integer comparison and never redraws catches
+@st.fragment(run_every=FEED_REFRESH_SECONDS)
+def render_new_catches():
+    last_seen_id = st.session_state.feed_last_seen_id
+    if shared.pubsub.latest_id('catches') > last_seen_id:
+        delta = shared.pubsub.since('catches', last_seen_id)
+        if delta is None:
+            # Too far behind the topic buffer: restart the feed from the store
+            st.session_state.feed_last_seen_id = catch_store.latest_id()
+            reanchor_feed()
+            st.rerun()
+        if delta:
+            st.session_state.feed_new_count += len(delta)
+            st.session_state.feed_last_seen_id = delta[-1]['id']
+    count = st.session_state.feed_new_count
+    if count and st.button(f"Show {count} new catch{'es' if count > 1 else ''}", key="show_new_catches"):
+        # Raising the anchor lets the feed below draw them as its first page
+        reanchor_feed()
+        st.rerun()
+
+@st.fragment
+def render_catch_feed():
+    corrections_version = shared.version('corrections')
+    before_id = st.session_state.feed_anchor_id + 1
+    for page_number in range(st.session_state.feed_pages):
+        page = load_feed_page(catch_store, before_id, corrections_version)
+        if not page and page_number == 0:
+            st.info("No catches yet – be the first!")
+        for catch in page:
+            render_catch(catch)
+        if len(page) < FEED_SIZE:
+            return
+        # Keyset cursor: the next page starts below the last id shown
+        before_id = page[-1]['id']
+    st.button("Load older catches", on_click=load_older_catches)
+
+def render_event_day(event):
+    today = date.today()
+    window = shared.events.window(event, today)
+    if window is None:
+        st.info("No fishing today for this event")
+        return
+    st.write(
+        f"Today's wristband color: **{shared.events.wristband_color(event, today)}** | "
+        f"Catches accepted {window[0]:%H:%M}–{window[1]:%H:%M}"
+    )
+    if st.session_state.role != "Angler/Team":
+        st.write(f"Anglers checked in today: {len(shared.events.checked_in(event, today))}")
+    elif event in shared.events.angler_events(st.session_state.logged_user, today):
+        st.success("You are checked in for today")
+    elif st.button("Check in for today", key=f"check_in_{event}"):
+        shared.check_in(event, st.session_state.logged_user, today)
+        st.rerun()
+
+def render_leaderboards(event):
+    st.subheader("Leaderboards")
+    col_division, col_species = st.columns(2)
+    with col_division:
+        division = st.selectbox("Division", DIVISIONS, key=f"lb_division_{event}")
+    with col_species:
+        species = st.selectbox("Species", SPECIES_OPTIONS, key=f"lb_species_{event}")
+    heaviest = leaderboard.heaviest_fish(event, division, species)
+    if not heaviest:
+        st.info("No catches in this division yet")
+        return
+    col_fish, col_anglers, col_captains = st.columns(3)
+    with col_fish:
+        st.write("**Heaviest Fish**")
+        st.dataframe(pd.DataFrame(heaviest, columns=['angler', 'captain', 'weight']), hide_index=True)
+    with col_anglers:
+        st.write("**Angler/Team Totals**")
+        st.dataframe(pd.DataFrame(leaderboard.top_anglers(event, division, species), columns=['angler', 'weight']), hide_index=True)
+    with col_captains:
+        st.write("**Captain Totals**")
+        st.dataframe(pd.DataFrame(leaderboard.top_captains(event, division, species), columns=['captain', 'weight']), hide_index=True)
+
+def render_event_export(event):
+    st.subheader("Export Data")
+    col_division, col_from, col_to, col_format = st.columns(4)
+    with col_division:
+        division = st.selectbox("Division", ["All"] + DIVISIONS, key=f"export_division_{event}")
+    with col_from:
+        start_date = st.date_input("From", value=None, key=f"export_from_{event}")
+    with col_to:
+        end_date = st.date_input("To", value=None, key=f"export_to_{event}")
+    with col_format:
+        export_format = st.selectbox("Format", ["CSV", "Parquet"], key=f"export_format_{event}")
+    if st.button("Prepare catch export", key=f"export_{event}"):
+        # Streamed to disk chunk by chunk, but Streamlit serves a download from
+        # memory, so the finished file is read back whole; keep very large
+        # exports to a division or date range
+        export_dir = os.path.join(DATA_DIR, "exports")
+        os.makedirs(export_dir, exist_ok=True)
+        ext = export_format.lower()
+        export = bulk_data.export_catches_csv if ext == "csv" else bulk_data.export_catches_parquet
+        # A fresh file per export, removed once the button holds its bytes, so
+        # concurrent exports never share a path and usernames never form one
+        with tempfile.NamedTemporaryFile(dir=export_dir, suffix=f".{ext}") as tmp:
+            rows = export(
+                catch_store,
+                tmp.name,
+                event=event,
+                division=None if division == "All" else division,
+                start_date=start_date.isoformat() if start_date else None,
+                end_date=end_date.isoformat() if end_date else None,
+            )
+            with open(tmp.name, "rb") as f:
+                st.download_button(
+                    f"Download {rows} catches",
+                    f,
+                    file_name=f"{st.session_state.logged_user}_catches.{ext}",
+                    key=f"download_{event}",
+                )
+    # Callables are only run when the button is clicked, not on every rerun
+    st.download_button(
+        "Download registrations (CSV)",
+        lambda: bulk_data.event_registrations_frame({event: shared.events[event]}).to_csv(index=False),
+        file_name="registrations.csv",
+        mime="text/csv",
+        key=f"download_registrations_{event}",
+    )
+
+    def anglers_csv():
+        anglers = [
+            username for username in shared.events[event]['registered_users']
+            if shared.users.get(username, {}).get('role') != "Captain"
+        ]
+        return bulk_data.users_frame(shared.users, anglers).to_csv(index=False)
+
+    st.download_button(
+        "Download registered anglers (CSV)",
+        anglers_csv,
+        file_name="anglers.csv",
+        mime="text/csv",
+        key=f"download_anglers_{event}",
+    )
+
+def render_catch_import():
+    uploaded = st.file_uploader("Restore catches from an export", type=["csv", "parquet"], key="catch_import")
+    if uploaded and st.button(f"Import {uploaded.name}"):
+        load = bulk_data.import_catches_csv if uploaded.name.endswith(".csv") else bulk_data.import_catches_parquet
+        try:
+            with metrics.span("handler.catch_import"):
+                rows = shared.bulk_import(load, uploaded)
+        except (KeyError, ValueError) as e:
+            st.error(f"Couldn't import {uploaded.name}: {e}")
+        else:
+            st.success(f"Imported {rows:,} catches")
+
+def render_reuse_flags():
+    flags = fingerprints.flags()
+    if not flags:
+        st.info("No suspected video reuse")
+        return
+    for flag in flags:
+        catch, other = catch_store.get(flag.catch_id), catch_store.get(flag.other_catch_id)
+        st.write(
+            f"**Catch #{flag.catch_id}** {VIDEO_FIELDS[flag.video].lower()} video vs "
+            f"**catch #{flag.other_catch_id}** {VIDEO_FIELDS[flag.other_video].lower()} video: {flag.reason}"
+        )
+        col_catch, col_other, col_actions = st.columns(3)
+        for col, shown in ((col_catch, catch), (col_other, other)):
+            with col:
+                st.caption(f"Captain {shown['captain']}: {catch_label(shown)}")
+        with col_actions:
+            key = "_".join(map(str, flag.key))
+            if not catch['disqualified'] and st.button(f"Disqualify #{flag.catch_id}", key=f"dq_{key}"):
+                shared.disqualify_catch(flag.catch_id)
+                fingerprints.dismiss(flag)
+                st.rerun()
+            if st.button("Dismiss", key=f"dismiss_{key}"):
+                fingerprints.dismiss(flag)
+                st.rerun()
+        st.divider()
+
+# Chart data is cached per catches version, so reruns between submissions
+# reuse it and a new catch recomputes it from the rollups
+@st.cache_data(max_entries=64)
+def season_dashboard(_analytics, catches_version, start, end):
+    return {
+        'daily': _analytics.daily_volume(start, end),
+        'species_by_location': _analytics.species_by_location(start, end),
+        'weights': _analytics.weight_distribution(start, end),
+        'counties': _analytics.county_activity(start, end),
+        'captains': _analytics.captain_activity(10),
+    }
+
+def render_season_analytics():
+    # Building the charts' Vega-Lite specs is most of a rerun, and Streamlit
+    # redoes it on every chart call, so the dashboard is drawn only on request
+    if not st.toggle("Show season dashboard", key="analytics_shown"):
+        st.caption(f"Catches this season: {len(shared.analytics):,}")
+        return
+    date_range = st.date_input("Date range", value=(), key="analytics_range")
+    start, end = (tuple(date_range) + (None, None))[:2]
+    dashboard = season_dashboard(shared.analytics, shared.version('catches'), start, end)
+    if not dashboard['daily'].sum():
+        st.info("No catches in this range yet")
+        return
+    st.subheader("Daily Catch Volume")
+    st.line_chart(dashboard['daily'])
+    st.subheader("Species by Weigh-In Location")
+    st.bar_chart(dashboard['species_by_location'], horizontal=True)
+    col_weights, col_counties = st.columns(2)
+    with col_weights:
+        st.subheader("Weight Distribution by Division (lbs)")
+        st.bar_chart(dashboard['weights'], stack=False)
+    with col_counties:
+        st.subheader("Catches by Captain County")
+        st.bar_chart(dashboard['counties'])
+    st.subheader("Most Active Captains")
+    st.dataframe(dashboard['captains'])
+
+def render_performance():
+    summary = pd.DataFrame(metrics.summary())
+    if not summary.empty:
+        st.dataframe(summary, hide_index=True)
+        st.download_button(
+            "Download metrics (CSV)",
+            summary.to_csv(index=False),
+            file_name="rerun_metrics.csv",
+        )
+    else:
+        st.info("No reruns timed yet")
+    if metrics.log_path:
+        st.caption(f"Each rerun's spans are appended to {metrics.log_path}")
+    if st.button("Profile next rerun"):
+        st.session_state.profile_next_rerun = True
+        st.rerun()
+    if report := st.session_state.get('profile_report'):
+        st.caption(f"cProfile of one rerun, saved to {st.session_state.profile_path}")
+        st.code(report)
 
 # App UI
 st.set_page_config(page_title="Everyday Angler App", layout="wide")
@@ -155,54 +508,54 @@ if st.session_state.logged_user is None:
     col_demo1, col_demo2 = st.columns(2)
     with col_demo1:
         if st.button("Test as Captain"):
-            st.session_state.logged_user = "testcaptain"
-            st.session_state.role = "Captain"
-            st.session_state.user_data = {
-                'role': "Captain",
-                'active': True,
-                'picture': None,
-                'phone': "",
-                'email': "",
-                'website': "",
-                'instagram': "",
-                'facebook': "",
-                'tiktok': "",
-                'youtube': "",
-                'x': "",
-                'bio': "",
-                'county': "Palm Beach",
-                'state': "Florida",
-                'events': []
-            }
-            if "testcaptain" not in st.session_state.users:
-                st.session_state.users["testcaptain"] = {'password': "test"}
-            st.rerun()
+            if error := register_test_user("testcaptain"):
+                st.error(error)
+            else:
+                start_session("testcaptain", "Captain", {
+                    'role': "Captain",
+                    'active': True,
+                    'picture': None,
+                    'phone': "",
+                    'email': "",
+                    'website': "",
+                    'instagram': "",
+                    'facebook': "",
+                    'tiktok': "",
+                    'youtube': "",
+                    'x': "",
+                    'bio': "",
+                    'county': "Palm Beach",
+                    'state': "Florida",
+                    'events': []
+                })
+                st.rerun()
     with col_demo2:
         if st.button("Test as Angler/Team"):
-            st.session_state.logged_user = "testangler"
-            st.session_state.role = "Angler/Team"
-            st.session_state.user_data = {
-                'role': "Angler/Team",
-                'active': True,
-                'picture': None,
-                'phone': "",
-                'email': "",
-                'website': "",
-                'instagram': "",
-                'facebook': "",
-                'tiktok': "",
-                'youtube': "",
-                'x': "",
-                'bio': "",
-                'county': "",
-                'state': "",
-                'events': []
-            }
-            if "testangler" not in st.session_state.users:
-                st.session_state.users["testangler"] = {'password': "test"}
-            if "testangler" not in st.session_state.daily_anglers:
-                st.session_state.daily_anglers.append("testangler")
-            st.rerun()
+            if error := register_test_user("testangler"):
+                st.error(error)
+            else:
+                start_session("testangler", "Angler/Team", {
+                    'role': "Angler/Team",
+                    'active': True,
+                    'picture': None,
+                    'phone': "",
+                    'email': "",
+                    'website': "",
+                    'instagram': "",
+                    'facebook': "",
+                    'tiktok': "",
+                    'youtube': "",
+                    'x': "",
+                    'bio': "",
+                    'county': "",
+                    'state': "",
+                    'events': []
+                })
+                # Signed up and checked in to whatever is running today
+                for event_name in shared.events.events_on(date.today()):
+                    shared.register_for_event(event_name, "testangler")
+                    shared.check_in(event_name, "testangler")
+                st.rerun()
 
     st.divider()
 
@@ -214,11 +567,17 @@ if st.session_state.logged_user is None:
             password = st.text_input("Password", type="password")
             submitted = st.form_submit_button("Login")
             if submitted:
-                if login(username, password):
-                    st.success("Logged in!")
-                    st.rerun()
+                try:
+                    with metrics.span("handler.login"):
+                        logged_in = login(username, password)
+                except (AuthBusy, RateLimited) as e:
+                    st.error(str(e))
                 else:
-                    st.error("Invalid credentials")
+                    if logged_in:
+                        st.success("Logged in!")
+                        st.rerun()
+                    else:
+                        st.error("Invalid credentials")
     with col2:
         st.header("Register")
         with st.form("register"):
@@ -233,24 +592,33 @@ if st.session_state.logged_user is None:
             if reg_sub:
                 if role == "Captain" and not agree:
                     st.error("You must agree to the statement")
-                elif register(new_user, new_pass, confirm_pass, role):
-                    st.success("Registered! Log in to complete your profile.")
+                else:
+                    with metrics.span("handler.register"):
+                        registered = register(new_user, new_pass, confirm_pass, role)
+                    if registered:
+                        st.success("Registered! Log in to complete your profile.")
+elif not auth.verify_token(st.session_state.get('auth_token'), st.session_state.logged_user):
+    end_session()
+    st.warning("Your session expired, please log in again")
+    st.button("Back to login")
 else:
     user_data = st.session_state.user_data
     st.success(f"Logged in as **{st.session_state.logged_user}** ({user_data['role']})")
     if st.button("Logout"):
-        st.session_state.logged_user = None
-        st.session_state.role = None
+        end_session()
         st.rerun()
 
     # Tabs with Submit Catch as dedicated tab for Captains
-    tab_names = ["My Profile", "Live Catch Feed", "Captains Directory", "Events", "My Events"]
+    tab_names = ["My Profile", "Live Catch Feed", "Captains Directory", "Events", "My Events", "Season Analytics"]
     if st.session_state.role == "Captain":
         tab_names.insert(1, "Submit Catch")
+    if st.session_state.logged_user in STAFF_USERS:
+        tab_names.insert(-1, "Video Review")
+        tab_names.append("Performance")
     tabs = st.tabs(tab_names)
 
     # My Profile
-    with tabs[0]:
+    with tabs[0], metrics.span("tab.profile"):
         st.header(st.session_state.logged_user)
 
         # Profile picture (left-aligned)
@@ -258,15 +626,23 @@ else:
         if user_data.get('picture') is None:
             uploaded_pic = st.file_uploader("Upload Profile Picture", type=["jpg", "png", "jpeg"])
         else:
-            st.image(user_data['picture'], width=200)
+            st.image(profile_picture(user_data['picture'], 400), width=200)
             if st.button("Change Profile Picture"):
                 uploaded_pic = st.file_uploader("Upload New Profile Picture", type=["jpg", "png", "jpeg"], key="new_pic")
 
         if uploaded_pic:
-            fixed_img = fix_image_orientation(uploaded_pic)
-            user_data['picture'] = fixed_img
-            st.success("Profile picture updated!")
-            st.rerun()
+            try:
+                with metrics.span("handler.profile_picture"):
+                    picture = normalize_image(uploaded_pic)
+            except ImageError as e:
+                st.error(str(e))
+            else:
+                picture_id = blob_store.put(io.BytesIO(picture), ".jpg")
+                media.submit_profile_picture(picture_id, blob_store.path(picture_id))
+                user_data['picture'] = picture_id
+                shared.save_profile(st.session_state.logged_user, {'picture': picture_id})
+                st.success("Profile picture updated!")
+                st.rerun()
 
         # County, State directly under picture (for Captains)
         if user_data['role'] == "Captain":
@@ -300,89 +676,123 @@ else:
             with col_county_state[1]:
                 user_data['state'] = st.text_input("State", value=user_data.get('state', ""))
         if st.button("Save Profile"):
+            shared.save_profile(st.session_state.logged_user, {field: user_data.get(field, "") for field in PROFILE_FIELDS})
             st.success("Profile saved successfully!")
             st.rerun()
 
     # Submit Catch tab (only for Captains)
     if st.session_state.role == "Captain":
-        with tabs[1]:
+        with tabs[1], metrics.span("tab.submit_catch"):
             st.header("Submit Catch")
-            st.info(f"Today's wristband color: **{st.session_state.wristband_color.get('Everyday Angler Charter Tournament', 'Red')}**")
-            with st.form("submit_catch", clear_on_submit=True):
-                division = st.selectbox("Division", ["Pelagic", "Reef"])
-                species = st.selectbox("Species", SPECIES_OPTIONS)
-                angler_name = st.selectbox("Angler/Team Name", st.session_state.daily_anglers if st.session_state.daily_anglers else ["No registered anglers yet"])
-                certifying_captain = st.text_input("Certifying Captain", value=st.session_state.logged_user, disabled=True)
-                weight = st.number_input("Weight (lbs)", min_value=0.0, step=0.1)
-                weigh_in_location = st.selectbox("Weigh-In Location", WEIGH_IN_LOCATIONS)
-                colv1, colv2 = st.columns(2)
-                with colv1:
-                    landing_video = st.file_uploader("Landing Video (show wristband)", type=["mp4", "mov"])
-                with colv2:
-                    weighin_video = st.file_uploader("Weigh-in Video (show wristband + scale)", type=["mp4", "mov"])
-                confirm_password = st.text_input("Re-enter password to confirm", type="password")
-                submitted = st.form_submit_button("Submit Catch")
-                if submitted:
-                    actual_password = st.session_state.users.get(st.session_state.logged_user, {}).get('password', "test")
-                    if not st.session_state.daily_anglers:
-                        st.error("No registered anglers yet")
-                    elif certifying_captain != st.session_state.logged_user:
-                        st.error("Certifying Captain must be you")
-                    elif actual_password != confirm_password:
-                        st.error("Password incorrect")
-                    elif landing_video and landing_video.size < 500000:
-                        st.error("Landing video too short")
-                    elif weighin_video and weighin_video.size < 500000:
-                        st.error("Weigh-in video too short")
-                    else:
-                        st.session_state.catches.append({
-                            'captain': st.session_state.logged_user,
-                            'angler': angler_name,
-                            'division': division,
-                            'species': species,
-                            'weight': weight,
-                            'weigh_in': weigh_in_location,
-                            'landing_video': landing_video.name if landing_video else "Missing",
-                            'weighin_video': weighin_video.name if weighin_video else "Missing",
-                            'date': datetime.now().strftime("%Y-%m-%d")
-                        })
-                        st.success("Catch submitted successfully!")
+            open_events = shared.events.open_events()
+            if not open_events:
+                st.info("No events are accepting catches right now")
+            else:
+                # Outside the form so the angler list follows the chosen event
+                event = st.selectbox("Event", open_events, key='catch_event')
+                st.info(f"Today's wristband color: **{shared.events.wristband_color(event)}**")
+                # Only the top matches are sent to the browser, not every checked-in angler
+                angler_query = st.text_input("Find angler/team", placeholder="Start typing a name", key='catch_angler_query')
+                anglers = shared.events.search_checked_in(event, angler_query)
+                with st.form("submit_catch", clear_on_submit=True):
+                    division = st.selectbox("Division", DIVISIONS)
+                    species = st.selectbox("Species", SPECIES_OPTIONS)
+                    angler_name = st.selectbox("Angler/Team Name", anglers if anglers else ["No matching anglers checked in today"])
+                    certifying_captain = st.text_input("Certifying Captain", value=st.session_state.logged_user, disabled=True)
+                    weight = st.number_input("Weight (lbs)", min_value=0.0, max_value=MAX_WEIGHT_LBS, step=0.1)
+                    weigh_in_location = st.selectbox("Weigh-In Location", WEIGH_IN_LOCATIONS)
+                    colv1, colv2 = st.columns(2)
+                    with colv1:
+                        landing_video = st.file_uploader("Landing Video (show wristband)", type=["mp4", "mov"])
+                    with colv2:
+                        weighin_video = st.file_uploader("Weigh-in Video (show wristband + scale)", type=["mp4", "mov"])
+                    confirmed = auth.verify_token(st.session_state.get('confirm_token'), st.session_state.logged_user, "confirm")
+                    if not confirmed:
+                        confirm_password = st.text_input("Re-enter password to confirm", type="password")
+                    submitted = st.form_submit_button("Submit Catch")
+                    if submitted:
+                        with metrics.span("handler.submit_catch"):
+                            if not anglers:
+                                st.error(f"No anglers checked in to {event} today match that name")
+                            elif certifying_captain != st.session_state.logged_user:
+                                st.error("Certifying Captain must be you")
+                            elif catch_error := shared.events.catch_error(event, angler_name):
+                                # Checked before the uploads so a closed window stores no videos
+                                st.error(catch_error)
+                            elif not confirmed and (password_error := confirm_catch_password(confirm_password)):
+                                st.error(password_error)
+                            else:
+                                # Both videos are streamed to disk and probed in parallel
+                                uploads = {
+                                    label: video_ingestor.submit(video, video.name)
+                                    for label, video in (("Landing", landing_video), ("Weigh-in", weighin_video))
+                                    if video
+                                }
+                                videos = {label: upload.result() for label, upload in uploads.items()}
+                                video_errors = [f"{label} video {result.error}" for label, result in videos.items() if result.error]
+                                if video_errors:
+                                    st.error("; ".join(video_errors))
+                                else:
+                                    catch = {
+                                        'event': event,
+                                        'captain': st.session_state.logged_user,
+                                        'angler': angler_name,
+                                        'division': division,
+                                        'species': species,
+                                        'weight': weight,
+                                        'weigh_in': weigh_in_location,
+                                        'landing_video': videos["Landing"].blob_id if "Landing" in videos else "Missing",
+                                        'weighin_video': videos["Weigh-in"].blob_id if "Weigh-in" in videos else "Missing",
+                                        'date': datetime.now().strftime("%Y-%m-%d")
+                                    }
+                                    try:
+                                        catch_id = shared.submit_catch(catch)
+                                    except CatchRejected as e:
+                                        # The window closed while the videos uploaded
+                                        st.error(str(e))
+                                    else:
+                                        for result in videos.values():
+                                            media.submit_video_poster(result.blob_id, blob_store.path(result.blob_id))
+                                        # Reuse checks run in the background and flag to staff
+                                        for field, label in VIDEO_FIELDS.items():
+                                            if label in videos:
+                                                fingerprints.submit(catch_id, field, catch[field], blob_store.path(catch[field]))
+                                        st.success("Catch submitted successfully!")
 
     # Live Catch Feed
     tab_index = 1 if st.session_state.role == "Angler/Team" else 2
-    with tabs[tab_index]:
+    with tabs[tab_index], metrics.span("tab.feed"):
         st.header("Live Catch Feed")
-        if st.session_state.catches:
-            for catch in reversed(st.session_state.catches):
-                with st.expander(f"{catch['angler']} – {catch['weight']:.2f} lbs – {catch['species']} – {catch['date']}"):
-                    st.write(f"Captain: {catch['captain']} | Weigh-In: {catch['weigh_in']}")
-                    colv1, colv2 = st.columns(2)
-                    with colv1:
-                        if catch['landing_video'] != "Missing":
-                            st.video("https://via.placeholder.com/150?text=Landing+Video")
-                        else:
-                            st.info("Landing video missing")
-                    with colv2:
-                        if catch['weighin_video'] != "Missing":
-                            st.video("https://via.placeholder.com/150?text=Weigh-in+Video")
-                        else:
-                            st.info("Weigh-in video missing")
-        else:
-            st.info("No catches yet – be the first!")
+        init_feed_state()
+        with metrics.span("feed.new_catches"):
+            render_new_catches()
+        with metrics.span("feed.pages"):
+            render_catch_feed()
 
     # Captains Directory
     tab_index = 2 if st.session_state.role == "Angler/Team" else 3
-    with tabs[tab_index]:
+    with tabs[tab_index], metrics.span("tab.directory"):
         st.header("Captains Directory")
-        county_filter = st.selectbox("Filter by County", ["All"] + COUNTIES)
-        captains = [u for u in st.session_state.users.values() if u.get('role') == "Captain"]
-        if county_filter != "All":
-            captains = [c for c in captains if c.get('county') == county_filter]
-        for captain in captains:
-            username = [k for k, v in st.session_state.users.items() if v == captain][0]
+        col_county, col_search = st.columns(2)
+        with col_county:
+            county_filter = st.selectbox("Filter by County", ["All"] + COUNTIES)
+        with col_search:
+            directory_query = st.text_input("Search captains", placeholder="Name or bio keywords")
+        directory_filters = dict(county=None if county_filter == "All" else county_filter, query=directory_query)
+        directory_page = st.session_state.get('directory_page', 1)
+        with metrics.span("directory.query"):
+            captains, total_captains = shared.users.directory("Captain", page=directory_page - 1, **directory_filters)
+        page_count = max(1, -(-total_captains // DIRECTORY_PAGE_SIZE))
+        if directory_page > page_count:
+            # Filters narrowed the results below the current page
+            st.session_state.directory_page = page_count
+            captains, _ = shared.users.directory("Captain", page=page_count - 1, **directory_filters)
+        if page_count > 1:
+            st.number_input(f"Page (of {page_count})", min_value=1, max_value=page_count, key='directory_page')
+        for username, captain in captains:
             with st.expander(f"{username} – {captain.get('county', 'N/A')}, {captain.get('state', 'FL')}"):
                 if captain.get('picture'):
-                    st.image(captain['picture'], width=150)
+                    st.image(profile_picture(captain['picture'], 150), width=150)
                 st.write(f"Phone: {captain.get('phone', 'N/A')}")
                 st.write(f"Email: {captain.get('email', 'N/A')}")
                 if captain.get('website'):
@@ -402,9 +812,9 @@ else:
 
     # Events
     tab_index = 3 if st.session_state.role == "Angler/Team" else 4
-    with tabs[tab_index]:
+    with tabs[tab_index], metrics.span("tab.events"):
         st.header("Available Events")
-        for event_name, event_data in st.session_state.events.items():
+        for event_name, event_data in shared.events.items():
             with st.expander(event_name):
                 st.write(event_data['description'])
                 st.write(f"Start: {event_data['start']} | End: {event_data['end']}")
@@ -412,22 +822,52 @@ else:
                     st.success("You are registered for this event")
                 else:
                     if st.button(f"Register for {event_name}", key=event_name):
-                        event_data['registered_users'].append(st.session_state.logged_user)
-                        user_data['events'].append(event_name)
+                        shared.register_for_event(event_name, st.session_state.logged_user)
                         st.success(f"Registered for {event_name}!")
 
     # My Events
     tab_index = 4 if st.session_state.role == "Angler/Team" else 5
-    with tabs[tab_index]:
+    with tabs[tab_index], metrics.span("tab.my_events"):
         st.header("My Events")
-        if user_data['events']:
-            for event in user_data['events']:
-                event_data = st.session_state.events[event]
+        # From the engine, not the profile, so every session of a user agrees
+        if my_events := shared.events.registered_events(st.session_state.logged_user):
+            for event in my_events:
+                event_data = shared.events[event]
                 with st.expander(event):
                     st.write(event_data['description'])
                     st.write(f"Start: {event_data['start']} | End: {event_data['end']}")
-                    st.info("Event features (daily registration, catch submission, leaderboards) coming soon!")
+                    render_event_day(event)
+                    render_leaderboards(event)
+                    # Exports include anglers' contact details
+                    if st.session_state.logged_user in STAFF_USERS:
+                        render_event_export(event)
         else:
             st.info("Join an event from the Events tab")
 
+    # Video Review (staff only)
+    if st.session_state.logged_user in STAFF_USERS:
+        with tabs[tab_names.index("Video Review")], metrics.span("tab.video_review"):
+            st.header("Video Review")
+            render_reuse_flags()
+
+    # Season Analytics
+    with tabs[tab_names.index("Season Analytics")], metrics.span("tab.analytics"):
+        st.header("Season Analytics")
+        render_season_analytics()
+
+    # Performance (staff only)
+    if st.session_state.logged_user in STAFF_USERS:
+        with tabs[-1], metrics.span("tab.performance"):
+            st.header("Performance")
+            render_performance()
+            st.subheader("Import Catches")
+            render_catch_import()
+
 st.caption("Everyday Angler App – Your home for charter tournaments | Tight lines!")
+
+metrics.end_rerun(user=st.session_state.logged_user, role=st.session_state.role)
+# Profiling one rerun: keep the report for the Performance tab and rerun to show it
+if profiler := st.session_state.pop('profiler', None):
+    st.session_state.profile_path = os.path.join(DATA_DIR, "profiles", f"rerun-{datetime.now():%Y%m%d-%H%M%S}.prof")
+    st.session_state.profile_report = finish_profile(profiler, st.session_state.profile_path)
+    st.rerun()
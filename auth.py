@@ -0,0 +1,177 @@
+import base64
+import hashlib
+import hmac
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+
+# scrypt cost: ~16 MB and tens of milliseconds per hash
+SCRYPT_N = 2 ** 14
+SCRYPT_R = 8
+SCRYPT_P = 1
+
+HASH_WORKERS = 4
+HASH_TIMEOUT_SECONDS = 30
+# Share of HASH_TIMEOUT_SECONDS a full queue may take to drain; the cap on
+# pending hashes is derived from this and the measured hash time
+HASH_QUEUE_BUDGET = 0.5
+
+LOGIN_ATTEMPTS = 5
+LOGIN_WINDOW_SECONDS = 60
+
+SESSION_TOKEN_SECONDS = 12 * 60 * 60
+CONFIRM_TOKEN_SECONDS = 15 * 60
+
+
+class AuthBusy(Exception):
+    pass
+
+
+class RateLimited(Exception):
+    pass
+
+
+def _b64(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _unb64(text):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+def hash_password(password, salt=None, n=SCRYPT_N, r=SCRYPT_R, p=SCRYPT_P):
+    salt = salt or os.urandom(16)
+    digest = hashlib.scrypt(password.encode(), salt=salt, n=n, r=r, p=p)
+    return f"scrypt${n}${r}${p}${_b64(salt)}${_b64(digest)}"
+
+
+def verify_password(password, stored):
+    try:
+        scheme, n, r, p, salt, digest = stored.split("$")
+    except (AttributeError, ValueError):
+        return False
+    if scheme != "scrypt":
+        return False
+    candidate = hash_password(password, _unb64(salt), int(n), int(r), int(p))
+    return hmac.compare_digest(candidate.rsplit("$", 1)[1], digest)
+
+
+class RateLimiter:
+    """Sliding-window limit on attempts per key."""
+
+    def __init__(self, attempts=LOGIN_ATTEMPTS, window_seconds=LOGIN_WINDOW_SECONDS):
+        self.attempts = attempts
+        self.window_seconds = window_seconds
+        # key -> hit times; least recently hit key first, and never empty
+        self._hits = OrderedDict()
+        self._lock = threading.Lock()
+
+    def allow(self, key, now=None):
+        now = time.monotonic() if now is None else now
+        cutoff = now - self.window_seconds
+        with self._lock:
+            # Keys whose last hit has left the window are dropped, so keys
+            # that are never tried again don't pile up
+            while self._hits and next(iter(self._hits.values()))[-1] <= cutoff:
+                self._hits.popitem(last=False)
+            hits = self._hits.get(key, deque())
+            while hits and hits[0] <= cutoff:
+                hits.popleft()
+            if len(hits) >= self.attempts:
+                return False
+            hits.append(now)
+            self._hits[key] = hits
+            self._hits.move_to_end(key)
+            return True
+
+    def reset(self, key):
+        with self._lock:
+            self._hits.pop(key, None)
+
+
+class Auth:
+    """Password hashing on a bounded worker pool plus signed session tokens.
+
+    Script threads hand scrypt work to the pool instead of running it
+    inline. By default only as many hashes may queue as the pool can
+    finish within half of HASH_TIMEOUT_SECONDS, measured with one hash at
+    startup; beyond that, and on a timeout, callers get AuthBusy. Unknown
+    usernames are checked against a dummy hash so they take as long as
+    real ones. Tokens are HMAC-signed "username:purpose:expiry" strings, so checking
+    one costs a single SHA-256 rather than a password hash.
+    """
+
+    def __init__(self, secret_key=None, workers=HASH_WORKERS, max_pending=None):
+        self._key = secret_key or secrets.token_bytes(32)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="auth")
+        start = time.perf_counter()
+        self._dummy_hash = hash_password(secrets.token_urlsafe(16))
+        if max_pending is None:
+            hashes_per_second = min(workers, os.cpu_count() or 1) / (time.perf_counter() - start)
+            max_pending = max(workers, int(hashes_per_second * HASH_TIMEOUT_SECONDS * HASH_QUEUE_BUDGET))
+        self.max_pending = max_pending
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self.limiter = RateLimiter()
+
+    def _run(self, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            raise AuthBusy("Too many sign-ins in progress, try again shortly")
+        try:
+            future = self._pool.submit(fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future
+
+    def hash_password_async(self, password):
+        return self._run(hash_password, password)
+
+    @staticmethod
+    def _result(future):
+        try:
+            return future.result(HASH_TIMEOUT_SECONDS)
+        except FutureTimeout:
+            future.cancel()
+            raise AuthBusy("Sign-in is taking too long, try again shortly") from None
+
+    def hash_password(self, password):
+        return self._result(self.hash_password_async(password))
+
+    def check_password_async(self, username, password, stored):
+        """Verify password against stored, or a dummy hash if stored is None."""
+        if not self.limiter.allow(username):
+            raise RateLimited("Too many attempts, wait a minute and try again")
+        return self._run(verify_password, password, stored or self._dummy_hash)
+
+    def check_password(self, username, password, stored):
+        ok = self._result(self.check_password_async(username, password, stored))
+        if ok:
+            self.limiter.reset(username)
+        return ok
+
+    def _sign(self, payload):
+        return _b64(hmac.new(self._key, payload.encode(), hashlib.sha256).digest())
+
+    def issue_token(self, username, purpose="session", ttl=SESSION_TOKEN_SECONDS):
+        payload = f"{_b64(username.encode())}:{purpose}:{int(time.time() + ttl)}"
+        return f"{payload}.{self._sign(payload)}"
+
+    def verify_token(self, token, username, purpose="session"):
+        if not token:
+            return False
+        payload, _, signature = token.rpartition(".")
+        if not hmac.compare_digest(self._sign(payload), signature):
+            return False
+        user_b64, token_purpose, expiry = payload.split(":")
+        return (
+            _unb64(user_b64).decode() == username
+            and token_purpose == purpose
+            and int(expiry) > time.time()
+        )
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,56 @@
+"""Season dashboard queries over the columnar analytics rollups.
+
+Usage: python benchmarks/bench_analytics.py [num_catches]
+"""
+import sys
+import time
+from datetime import date
+
+import pandas as pd
+from synthetic import LOCATIONS, percentile, synthetic_catches
+
+from analytics import SeasonAnalytics
+
+CHUNK = 100_000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    analytics = SeasonAnalytics(locations=LOCATIONS)
+
+    start = time.perf_counter()
+    chunk = []
+    for i, catch in enumerate(synthetic_catches(n), start=1):
+        catch['id'] = i
+        chunk.append(catch)
+        if len(chunk) == CHUNK:
+            analytics.add_frame(pd.DataFrame(chunk))
+            chunk = []
+    if chunk:
+        analytics.add_frame(pd.DataFrame(chunk))
+    print(f"loaded {n:,} catches in {time.perf_counter() - start:.2f}s")
+
+    samples = []
+    for i, catch in enumerate(synthetic_catches(200, seed=5), start=n + 1):
+        catch['id'] = i
+        t0 = time.perf_counter()
+        analytics.add(catch, "Broward")
+        samples.append((time.perf_counter() - t0) * 1000)
+    print(f"incremental add: p50 {percentile(samples, 50):.2f}ms p99 {percentile(samples, 99):.2f}ms")
+
+    ranges = {"season": (None, None), "march": (date(2026, 3, 1), date(2026, 3, 31))}
+    for label, (lo, hi) in ranges.items():
+        samples = []
+        for _ in range(50):
+            t0 = time.perf_counter()
+            analytics.daily_volume(lo, hi)
+            analytics.species_by_location(lo, hi)
+            analytics.weight_distribution(lo, hi)
+            analytics.county_activity(lo, hi)
+            analytics.captain_activity(10)
+            samples.append((time.perf_counter() - t0) * 1000)
+        print(f"full dashboard ({label}): p50 {percentile(samples, 50):.2f}ms p99 {percentile(samples, 99):.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
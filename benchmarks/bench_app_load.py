@@ -0,0 +1,133 @@
+"""Headless load test of app.py reruns with Streamlit's AppTest.
+
+Seeds a catch store, logs in N captains and M spectators (the quick test
+logins), then for each round has every captain submit a catch and every
+spectator refresh. Sessions take turns in one process, so this measures
+rerun cost against seeded data rather than contention. Reports rerun
+p50/p99 per role and the slowest spans from the app's metrics log.
+
+Catches are only accepted inside the event's daily window (05:00-21:00);
+outside it captain reruns still run but end in a rejection.
+
+Usage: python benchmarks/bench_app_load.py [--captains N] [--spectators M]
+       [--rounds R] [--catches K] [--max-p99 MS] [--profile]
+"""
+import argparse
+import json
+import os
+import secrets
+import sys
+import tempfile
+import time
+
+from synthetic import percentile, synthetic_catches
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+
+def timed_run(at, samples):
+    t0 = time.perf_counter()
+    at.run()
+    samples.append((time.perf_counter() - t0) * 1000)
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+
+
+def click(at, label):
+    next(b for b in at.button if b.label == label).click()
+
+
+def start_session(AppTest, login_label, timeout):
+    at = AppTest.from_file(APP, default_timeout=timeout)
+    at.run()
+    click(at, login_label)
+    at.run()
+    return at
+
+
+def submit_catch(at, weight, samples):
+    next(n for n in at.number_input if n.label == "Weight (lbs)").set_value(weight)
+    # The password is asked once, then a confirm token covers the session
+    for field in at.text_input:
+        if field.label.startswith("Re-enter password"):
+            field.input("test")
+    at.button(key="FormSubmitter:submit_catch-Submit Catch").click()
+    timed_run(at, samples)
+    return bool(at.success) and any("Catch submitted" in s.value for s in at.success)
+
+
+def summary(label, samples):
+    return (f"  {label:<22} p50 {percentile(samples, 50):7.1f}ms  p99 {percentile(samples, 99):7.1f}ms  "
+            f"max {max(samples):7.1f}ms  ({len(samples)} reruns)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--captains", type=int, default=5)
+    parser.add_argument("--spectators", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=10)
+    parser.add_argument("--catches", type=int, default=50_000, help="catches seeded before the app starts")
+    parser.add_argument("--max-p99", type=float, help="exit 1 if any role's rerun p99 exceeds this many ms")
+    parser.add_argument("--profile", action="store_true", help="print a cProfile of one spectator rerun")
+    parser.add_argument("--timeout", type=float, default=120)
+    args = parser.parse_args()
+
+    data_dir = tempfile.mkdtemp(prefix="angler-load-")
+    metrics_log = os.path.join(data_dir, "metrics.jsonl")
+    os.environ["ANGLER_DATA_DIR"] = data_dir
+    os.environ["ANGLER_METRICS_LOG"] = metrics_log
+    os.environ.setdefault("ANGLER_SECRET_KEY", secrets.token_hex(16))
+
+    from catch_store import CatchStore
+    from streamlit.testing.v1 import AppTest
+
+    start = time.perf_counter()
+    store = CatchStore(os.path.join(data_dir, "catches.db"))
+    store.add_many(synthetic_catches(args.catches))
+    store.close()
+    seeded = time.perf_counter() - start
+
+    start = time.perf_counter()
+    spectators = [start_session(AppTest, "Test as Angler/Team", args.timeout) for _ in range(args.spectators)]
+    captains = [start_session(AppTest, "Test as Captain", args.timeout) for _ in range(args.captains)]
+    logged_in = time.perf_counter() - start
+
+    captain_samples, spectator_samples = [], []
+    accepted = 0
+    for round_number in range(args.rounds):
+        for i, at in enumerate(captains):
+            accepted += submit_catch(at, 10 + round_number + i / 10, captain_samples)
+        for at in spectators:
+            timed_run(at, spectator_samples)
+
+    print(f"{args.captains} captains, {args.spectators} spectators, {args.rounds} rounds; "
+          f"{args.catches:,} catches seeded in {seeded:.1f}s, sessions logged in in {logged_in:.1f}s")
+    print(summary("captain submit", captain_samples) + f"  {accepted} accepted")
+    print(summary("spectator refresh", spectator_samples))
+
+    spans = {}
+    with open(metrics_log, encoding="utf-8") as f:
+        for line in f:
+            record = json.loads(line)
+            spans.setdefault("rerun (in app)", []).append(record['ms'])
+            for name, ms in record['spans'].items():
+                spans.setdefault(name, []).append(ms)
+    print("  slowest spans by p99:")
+    for name, samples in sorted(spans.items(), key=lambda item: percentile(item[1], 99), reverse=True)[:10]:
+        print("  " + summary(name, samples))
+
+    if args.profile and spectators:
+        at = spectators[0]
+        at.session_state['profile_next_rerun'] = True
+        at.run()
+        print(at.session_state['profile_report'])
+        print(f"  stats saved to {at.session_state['profile_path']}")
+
+    worst = max(percentile(s, 99) for s in (captain_samples, spectator_samples) if s)
+    if args.max_p99 is not None and worst > args.max_p99:
+        print(f"FAIL: rerun p99 {worst:.1f}ms exceeds {args.max_p99:.1f}ms")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Login throughput and script-thread latency during a login burst.
+
+Queues a burst of logins on the Auth hashing pool while the main thread
+keeps running a stand-in rerun workload. Logins beyond the derived
+admission cap are turned away with AuthBusy, as the app shows them.
+Reports logins/sec, the slowest admitted login against
+HASH_TIMEOUT_SECONDS, and rerun p50/p99 idle and while logins are in
+flight.
+
+Usage: python benchmarks/bench_auth.py [logins]
+"""
+import sys
+import time
+from concurrent.futures import wait
+
+from synthetic import percentile, synthetic_catches
+
+from auth import HASH_TIMEOUT_SECONDS, Auth, AuthBusy, hash_password
+
+CATCHES = list(synthetic_catches(500))
+
+
+def fake_rerun():
+    # Roughly what one rerun does in Python: format the visible feed rows
+    return [f"{c['angler']} – {c['weight']:.2f} lbs – {c['species']} – {c['date']}" for c in CATCHES]
+
+
+def rerun_latencies(until):
+    samples = []
+    while not until():
+        t0 = time.perf_counter()
+        fake_rerun()
+        samples.append((time.perf_counter() - t0) * 1000)
+        time.sleep(0.005)
+    return samples
+
+
+def main():
+    logins = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    auth = Auth()
+    stored = hash_password("correct horse")
+
+    deadline = time.perf_counter() + 1.0
+    idle = rerun_latencies(lambda: time.perf_counter() > deadline)
+
+    start = time.perf_counter()
+    futures = []
+    finished = []
+    turned_away = 0
+    for i in range(logins):
+        try:
+            future = auth.check_password_async(f"user{i}", "correct horse", stored)
+        except AuthBusy:
+            turned_away += 1
+            continue
+        future.add_done_callback(lambda _: finished.append(time.perf_counter() - start))
+        futures.append(future)
+    busy = rerun_latencies(lambda: all(f.done() for f in futures))
+    wait(futures)
+    elapsed = time.perf_counter() - start
+    ok = sum(f.result() for f in futures)
+
+    t0 = time.perf_counter()
+    token = auth.issue_token("user1", "confirm", 900)
+    for _ in range(10000):
+        auth.verify_token(token, "user1", "confirm")
+    token_us = (time.perf_counter() - t0) / 10000 * 1e6
+
+    print(f"admission cap {auth.max_pending}: {len(futures)} admitted, {turned_away} turned away with AuthBusy")
+    print(f"{ok}/{len(futures)} logins verified in {elapsed:.2f}s ({len(futures) / elapsed:,.0f} logins/s), "
+          f"slowest {max(finished):.1f}s vs {HASH_TIMEOUT_SECONDS}s timeout")
+    print(f"rerun idle:  p50 {percentile(idle, 50):.2f}ms p99 {percentile(idle, 99):.2f}ms")
+    print(f"rerun burst: p50 {percentile(busy, 50):.2f}ms p99 {percentile(busy, 99):.2f}ms")
+    print(f"confirm token check: {token_us:.1f}us")
+    auth.shutdown()
+
+
+if __name__ == "__main__":
+    main()
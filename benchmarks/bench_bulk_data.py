@@ -0,0 +1,75 @@
+"""Chunked catch export/import throughput and memory.
+
+Seeds a store, exports it to CSV and Parquet, then imports each file into
+a fresh store through SharedState.bulk_import, so import times include
+rebuilding the leaderboard and season analytics. Every step runs in its own process so the reported peak
+RSS belongs to that step alone.
+
+Usage: python benchmarks/bench_bulk_data.py [num_catches]
+"""
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from synthetic import synthetic_catches
+
+import bulk_data
+from catch_store import CatchStore
+from leaderboard import Leaderboard
+from shared_state import SharedState
+
+SEED_BATCH = 50000
+
+
+def seed(path, n):
+    store = CatchStore(path)
+    batch = []
+    for catch in synthetic_catches(n):
+        batch.append(catch)
+        if len(batch) == SEED_BATCH:
+            store.add_many(batch)
+            batch = []
+    store.add_many(batch)
+    store.close()
+
+
+def run_step(step, tmp):
+    source = os.path.join(tmp, "source.db")
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    start = time.perf_counter()
+    if step.startswith("export"):
+        store = CatchStore(source)
+        fmt = step.split("-")[1]
+        export = bulk_data.export_catches_csv if fmt == "csv" else bulk_data.export_catches_parquet
+        rows = export(store, os.path.join(tmp, f"catches.{fmt}"))
+    else:
+        fmt = step.split("-")[1]
+        store = CatchStore(os.path.join(tmp, f"restored_{fmt}.db"))
+        load = bulk_data.import_catches_csv if fmt == "csv" else bulk_data.import_catches_parquet
+        shared = SharedState(users={}, catch_store=store, leaderboard=Leaderboard(), events=None)
+        rows = shared.bulk_import(load, os.path.join(tmp, f"catches.{fmt}"))
+    elapsed = time.perf_counter() - start
+    store.close()
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{step:>14}: {rows:,} rows in {elapsed:.2f}s ({rows / elapsed:,.0f} rows/s), peak RSS {peak:.0f} MB "
+          f"({peak - baseline:.0f} MB above the {baseline:.0f} MB after imports)")
+
+
+def main():
+    if len(sys.argv) > 2:
+        run_step(sys.argv[1], sys.argv[2])
+        return
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        seed(os.path.join(tmp, "source.db"), n)
+        for step in ("export-csv", "export-parquet", "import-csv", "import-parquet"):
+            subprocess.run([sys.executable, __file__, step, tmp], check=True)
+        for fmt in ("csv", "parquet"):
+            print(f"{fmt} file: {os.path.getsize(os.path.join(tmp, f'catches.{fmt}')) / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
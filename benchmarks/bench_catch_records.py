@@ -0,0 +1,87 @@
+"""Bytes per catch: one dict per catch vs. the compact CatchTable.
+
+Seeds a store, then loads every catch in a separate process per layout
+and reports traced Python memory per catch, plus the cost of reading rows
+back through each layout.
+
+Usage: python benchmarks/bench_catch_records.py [num_catches]
+"""
+import hashlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from synthetic import synthetic_catches
+
+from catch_records import CatchTable
+from catch_store import CatchStore
+from leaderboard import Leaderboard
+
+SEED_BATCH = 50000
+
+
+def seed(path, n):
+    store = CatchStore(path)
+    batch = []
+    for i, catch in enumerate(synthetic_catches(n)):
+        # Real catches reference unique BlobStore ids, or "Missing"
+        for video in ('landing_video', 'weighin_video'):
+            digest = hashlib.sha256(f"{video}{i}".encode()).hexdigest()
+            catch[video] = "Missing" if i % 10 == 0 else digest + ".mp4"
+        batch.append(catch)
+        if len(batch) == SEED_BATCH:
+            store.add_many(batch)
+            batch = []
+    store.add_many(batch)
+    store.close()
+
+
+def load(layout, store):
+    if layout == "dicts":
+        return list(store.iter_catches())
+    if layout == "table":
+        table = CatchTable()
+        for catch in store.iter_catches():
+            table.append(catch)
+        return table
+    return Leaderboard.from_catches(store.iter_catches())
+
+
+def run_layout(layout, path):
+    store = CatchStore(path)
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    catches = load(layout, store)
+    elapsed = time.perf_counter() - start
+    used = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    n = store.count()
+    line = f"{layout:>11}: {used / n:6.0f} bytes/catch ({used / 1e6:,.0f} MB), load {elapsed:.1f}s"
+    if layout != "leaderboard":
+        start = time.perf_counter()
+        total = sum(catches[i]['weight'] for i in range(0, n, 100))
+        line += f", read {(time.perf_counter() - start) / (n // 100) * 1e6:.2f}us/row"
+        assert total > 0
+    print(line)
+    store.close()
+
+
+def main():
+    if len(sys.argv) > 2:
+        run_layout(sys.argv[1], sys.argv[2])
+        return
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catches.db")
+        seed(path, n)
+        print(f"{n:,} catches")
+        for layout in ("dicts", "table", "leaderboard"):
+            subprocess.run([sys.executable, __file__, layout, path], check=True)
+
+
+if __name__ == "__main__":
+    main()
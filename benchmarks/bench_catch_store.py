@@ -0,0 +1,44 @@
+"""Insert throughput and feed-query latency of the SQLite catch store.
+
+Usage: python benchmarks/bench_catch_store.py [num_catches]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from synthetic import percentile, synthetic_catches
+
+from catch_store import CatchStore
+
+BATCH = 10000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        store = CatchStore(os.path.join(tmp, "bench.db"))
+
+        start = time.perf_counter()
+        batch = []
+        for catch in synthetic_catches(n):
+            batch.append(catch)
+            if len(batch) == BATCH:
+                store.add_many(batch)
+                batch = []
+        if batch:
+            store.add_many(batch)
+        elapsed = time.perf_counter() - start
+        print(f"inserted {n:,} catches in {elapsed:.2f}s ({n / elapsed:,.0f} rows/s)")
+
+        samples = []
+        for _ in range(1000):
+            t0 = time.perf_counter()
+            store.latest(25)
+            samples.append((time.perf_counter() - t0) * 1000)
+        print(f"latest(25) p50={percentile(samples, 50):.3f}ms p99={percentile(samples, 99):.3f}ms")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
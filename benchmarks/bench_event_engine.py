@@ -0,0 +1,72 @@
+"""Event engine lookups with many concurrent tournaments.
+
+Schedules events of varying length across a year, checks anglers in to
+the events running on one day, then times the per-submission lookups
+against a linear scan over every event day.
+
+Usage: python benchmarks/bench_event_engine.py [num_events] [num_anglers]
+"""
+import random
+import sys
+import time
+from datetime import date, datetime, time as clock, timedelta
+
+from synthetic import percentile
+
+from event_engine import EventEngine
+
+YEAR_START = date(2026, 1, 1)
+
+
+def timed(fn, args_list):
+    samples = []
+    for args in args_list:
+        t0 = time.perf_counter()
+        fn(*args)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return f"p50 {percentile(samples, 50):.1f}us p99 {percentile(samples, 99):.1f}us"
+
+
+def main():
+    n_events = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    n_anglers = int(sys.argv[2]) if len(sys.argv) > 2 else 100_000
+    rng = random.Random(42)
+    engine = EventEngine()
+
+    start = time.perf_counter()
+    for i in range(n_events):
+        first = YEAR_START + timedelta(days=rng.randrange(365))
+        length = rng.choice([1, 3, 7, 30, 120, 300])
+        hours = (clock(rng.randrange(4, 8)), clock(rng.randrange(16, 22)))
+        engine.add_event(f"event{i}", "", first, first + timedelta(days=length - 1), hours)
+    day = YEAR_START + timedelta(days=180)
+    running = engine.events_on(day)
+    build = time.perf_counter() - start
+    windows = len(engine._windows)
+
+    for a in range(n_anglers):
+        name = f"angler{a}"
+        for event in rng.sample(running, min(2, len(running))):
+            engine[event]['registered_users'][name] = None
+            engine.check_in(event, name, day)
+    noon = datetime.combine(day, clock(12))
+    moments = [noon + timedelta(minutes=rng.randrange(-360, 360)) for _ in range(2000)]
+    anglers = [f"angler{rng.randrange(n_anglers)}" for _ in range(2000)]
+    events = [rng.choice(running) for _ in range(2000)]
+    all_days = [(name, d, w) for (name, d), w in engine._day_windows.items()]
+
+    def linear_open_events(at):
+        return sorted(name for name, _, (lo, hi) in all_days if lo <= at < hi)
+
+    print(f"{n_events:,} events, {windows:,} event days, {len(running)} running on {day}, "
+          f"{n_anglers:,} anglers checked in; scheduled in {build:.2f}s")
+    print(f"  open_events:        {timed(engine.open_events, [(m,) for m in moments])}")
+    print(f"  linear scan:        {timed(linear_open_events, [(m,) for m in moments[:50]])}")
+    print(f"  catch_error:        {timed(engine.catch_error, list(zip(events, anglers, moments)))}")
+    print(f"  angler_events:      {timed(engine.angler_events, [(a, day) for a in anglers])}")
+    print(f"  checked_in (event): {timed(engine.checked_in, [(e, day) for e in events])}")
+    print(f"  wristband_color:    {timed(engine.wristband_color, [(e, day) for e in events])}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""Live feed fan-out: pub/sub deltas vs. re-querying the feed per viewer.
+
+Simulates viewers polling for new catches once per tick, with and
+without new catches published between ticks.
+
+Usage: python benchmarks/bench_feed_pubsub.py [viewers] [ticks] [feed_size]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from synthetic import synthetic_catches
+
+from catch_store import CatchStore
+from pubsub import PubSub
+
+
+def main():
+    viewers = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    feed_size = int(sys.argv[3]) if len(sys.argv) > 3 else 100_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = CatchStore(os.path.join(tmp, "feed.db"))
+        store.add_many(synthetic_catches(feed_size))
+        bus = PubSub()
+        last_seen = [store.latest_id()] * viewers
+        new_catches = synthetic_catches(ticks * 10, seed=9)
+
+        for label, per_tick in (("idle", 0), ("busy", 10)):
+            delivered = 0
+            pubsub_time = requery_time = 0.0
+            for _ in range(ticks):
+                for _ in range(per_tick):
+                    catch = next(new_catches)
+                    catch['id'] = store.add(catch)
+                    bus.publish('catches', catch['id'], catch)
+
+                t0 = time.perf_counter()
+                for v in range(viewers):
+                    if bus.latest_id('catches') > last_seen[v]:
+                        delta = bus.since('catches', last_seen[v])
+                        delivered += len(delta)
+                        last_seen[v] = delta[-1]['id']
+                pubsub_time += time.perf_counter() - t0
+
+                t0 = time.perf_counter()
+                for v in range(viewers):
+                    store.latest(25)
+                requery_time += time.perf_counter() - t0
+
+            print(f"{label}: {viewers} viewers x {ticks} ticks | pub/sub {pubsub_time / ticks * 1000:.2f}ms/tick "
+                  f"({delivered} catches delivered) | re-query {requery_time / ticks * 1000:.2f}ms/tick")
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Per-image latency and peak memory of profile picture normalization.
+
+Compares the previous fix_image_orientation (full decode, ExifTags scan,
+rotate with expand=True, PIL Image kept in memory) with
+image_normalize.normalize_image over rotated 12 MP phone-style JPEGs.
+Each mode runs in its own process so peak RSS is measured separately.
+
+Usage: python benchmarks/bench_image_normalize.py [num_images]
+"""
+import io
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+from synthetic import percentile
+
+from PIL import ExifTags, Image
+
+from image_normalize import ORIENTATION_TAG, normalize_image
+
+
+def fix_image_orientation(uploaded_file):
+    # The implementation app.py used before image_normalize
+    if uploaded_file is None:
+        return None
+    image = Image.open(uploaded_file)
+    try:
+        for orientation in ExifTags.TAGS.keys():
+            if ExifTags.TAGS[orientation] == 'Orientation':
+                break
+        exif = image._getexif()
+        if exif is not None:
+            if orientation in exif:
+                if exif[orientation] == 3:
+                    image = image.rotate(180, expand=True)
+                elif exif[orientation] == 6:
+                    image = image.rotate(270, expand=True)
+                elif exif[orientation] == 8:
+                    image = image.rotate(90, expand=True)
+    except:  # noqa: E722
+        pass
+    return image
+
+
+def write_corpus(directory, n):
+    base = Image.linear_gradient("L").resize((4032, 3024)).convert("RGB")
+    for i in range(n):
+        exif = Image.Exif()
+        exif[ORIENTATION_TAG] = i % 8 + 1
+        base.save(os.path.join(directory, f"photo{i}.jpg"), "JPEG", quality=90, exif=exif)
+
+
+def run_mode(mode, directory):
+    paths = sorted(os.path.join(directory, name) for name in os.listdir(directory))
+    kept = []
+    samples = []
+    for path in paths:
+        with open(path, "rb") as f:
+            upload = io.BytesIO(f.read())
+        t0 = time.perf_counter()
+        if mode == "before":
+            # session_state held on to every decoded image
+            image = fix_image_orientation(upload)
+            image.load()
+            kept.append(image)
+        else:
+            kept.append(normalize_image(upload))
+        samples.append((time.perf_counter() - t0) * 1000)
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{mode:>6}: p50 {percentile(samples, 50):.1f}ms p99 {percentile(samples, 99):.1f}ms "
+          f"per image | peak RSS {peak:.0f} MB for {len(paths)} images")
+
+
+def main():
+    if len(sys.argv) > 2 and sys.argv[1] in ("before", "after"):
+        run_mode(sys.argv[1], sys.argv[2])
+        return
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 24
+    with tempfile.TemporaryDirectory() as tmp:
+        write_corpus(tmp, n)
+        for mode in ("before", "after"):
+            subprocess.run([sys.executable, __file__, mode, tmp], check=True)
+
+
+if __name__ == "__main__":
+    main()
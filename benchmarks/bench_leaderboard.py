@@ -0,0 +1,78 @@
+"""Incremental leaderboard vs. a full pandas recomputation per read.
+
+Usage: python benchmarks/bench_leaderboard.py [num_catches ...]
+"""
+import sys
+import time
+
+import pandas as pd
+from synthetic import percentile, synthetic_catches
+
+from leaderboard import Leaderboard
+
+KEY = ("Everyday Angler Charter Tournament", "Pelagic", "Wahoo")
+
+
+def naive_standings(df, event, division, species, k=10):
+    subset = df[(df.event == event) & (df.division == division) & (df.species == species)]
+    heaviest = subset.nlargest(k, 'weight')
+    anglers = subset.groupby('angler')['weight'].sum().nlargest(k)
+    captains = subset.groupby('captain')['weight'].sum().nlargest(k)
+    return heaviest, anglers, captains
+
+
+def run(n):
+    catches = list(synthetic_catches(n))
+    for i, catch in enumerate(catches, start=1):
+        catch['id'] = i
+
+    start = time.perf_counter()
+    leaderboard = Leaderboard.from_catches(catches)
+    build = time.perf_counter() - start
+
+    extra = list(synthetic_catches(1000, seed=7))
+    samples = []
+    for i, catch in enumerate(extra, start=n + 1):
+        catch['id'] = i
+        t0 = time.perf_counter()
+        leaderboard.add(catch)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    add_p99 = percentile(samples, 99)
+
+    samples = []
+    for catch_id in range(1, 1001):
+        t0 = time.perf_counter()
+        leaderboard.disqualify(catch_id)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    dq_p99 = percentile(samples, 99)
+
+    samples = []
+    for _ in range(1000):
+        t0 = time.perf_counter()
+        leaderboard.heaviest_fish(*KEY)
+        leaderboard.top_anglers(*KEY)
+        leaderboard.top_captains(*KEY)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    read_p99 = percentile(samples, 99)
+
+    df = pd.DataFrame(catches)
+    samples = []
+    for _ in range(10):
+        t0 = time.perf_counter()
+        naive_standings(df, *KEY)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    naive_p50 = percentile(samples, 50)
+
+    print(f"{n:,} catches: build {build:.2f}s | add p99 {add_p99:.1f}us | "
+          f"disqualify p99 {dq_p99:.1f}us | read p99 {read_p99:.1f}us | "
+          f"pandas recompute p50 {naive_p50 / 1000:.1f}ms")
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [100_000, 1_000_000]
+    for n in sizes:
+        run(n)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Per-keystroke angler search latency.
+
+Indexes synthetic angler/team names, then replays names being typed one
+character at a time (some with a typo) and times each search against a
+substring scan of the full list. Also reports how often a fully typed
+name with a typo still finds its target, and how often a typo'd first
+name alone ("jhon") still finds names starting with that word.
+
+Usage: python benchmarks/bench_name_index.py [num_anglers]
+"""
+import random
+import sys
+import time
+
+from synthetic import percentile
+
+from name_index import NameIndex
+
+FIRST = [
+    "James", "John", "Robert", "Michael", "William", "David", "Richard", "Joseph", "Thomas", "Carlos",
+    "Mary", "Patricia", "Jennifer", "Linda", "Elizabeth", "Barbara", "Susan", "Jessica", "Maria", "Ana",
+    "Luis", "Jose", "Daniel", "Matthew", "Anthony", "Mark", "Steven", "Paul", "Andrew", "Joshua",
+]
+LAST = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Gonzalez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Martin",
+    "Lee", "Perez", "Thompson", "White", "Harris", "Sanchez", "Clark", "Ramirez", "Lewis", "Robinson",
+]
+TEAM_WORDS = ["Reel", "Deal", "Tight", "Lines", "Salt", "Life", "Blue", "Water", "Hook", "Up", "Sea", "Wolf"]
+
+
+def synthetic_names(n, seed=42):
+    rng = random.Random(seed)
+    names = {}
+    while len(names) < n:
+        if rng.random() < 0.8:
+            name = f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+        else:
+            name = f"{rng.choice(TEAM_WORDS)} {rng.choice(TEAM_WORDS)} Team"
+        if name in names:
+            name = f"{name} {rng.randrange(1, 10000)}"
+        names[name] = None
+    return list(names)
+
+
+def with_typo(name, rng):
+    i = rng.randrange(1, len(name) - 2)
+    return name[:i] + name[i + 1] + name[i] + name[i + 2:]
+
+
+def keystrokes(names, count, rng):
+    for target in rng.sample(names, count):
+        typed = with_typo(target, rng) if rng.random() < 0.3 else target
+        for end in range(1, len(typed) + 1):
+            yield typed[:end]
+
+
+def timed(search, queries):
+    samples = []
+    for query in queries:
+        t0 = time.perf_counter()
+        search(query)
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return samples
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(7)
+    names = synthetic_names(n)
+
+    start = time.perf_counter()
+    index = NameIndex(names)
+    index.search("warm up")  # sorts the pending keys once
+    build = time.perf_counter() - start
+    queries = list(keystrokes(names, 300, rng))
+
+    samples = timed(index.search, queries)
+    print(f"{n:,} anglers indexed in {build:.2f}s; {len(queries):,} keystrokes")
+    print(f"  NameIndex.search:  p50 {percentile(samples, 50) / 1000:.2f}ms "
+          f"p99 {percentile(samples, 99) / 1000:.2f}ms max {max(samples) / 1000:.2f}ms")
+
+    lowered = [(name.lower(), name) for name in names]
+
+    def scan(query):
+        query = query.lower()
+        return [name for low, name in lowered if query in low][:20]
+
+    targets = rng.sample(names, 500)
+    found = sum(target in index.search(with_typo(target, rng)) for target in targets)
+    print(f"  typo'd full names found: {found}/{len(targets)}")
+
+    words = [word.lower() for word in FIRST if len(word) >= 4]
+    short = [(word, with_typo(word, rng)) for word in words for _ in range(5)]
+    samples, found = [], 0
+    for word, query in short:
+        t0 = time.perf_counter()
+        results = index.search(query)
+        samples.append((time.perf_counter() - t0) * 1e6)
+        found += any(name.lower().startswith(word) for name in results)
+    print(f"  typo'd first names found: {found}/{len(short)} "
+          f"(p50 {percentile(samples, 50) / 1000:.2f}ms p99 {percentile(samples, 99) / 1000:.2f}ms)")
+
+    samples = timed(scan, queries[:200])
+    print(f"  substring scan:    p50 {percentile(samples, 50) / 1000:.2f}ms p99 {percentile(samples, 99) / 1000:.2f}ms")
+    print(f"  options sent: 20 vs {n:,} "
+          f"({sum(len(name) for name in names) / 1e6:.1f} MB of names for the full list)")
+
+
+if __name__ == "__main__":
+    main()
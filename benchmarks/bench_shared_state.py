@@ -0,0 +1,102 @@
+"""Concurrent sessions writing to the shared application state.
+
+Simulates many sessions on separate threads. Each registers a captain
+and an angler, signs both up for the event, checks the angler in and
+submits catches, while a watcher waits on change notifications. Exits
+non-zero if any write was lost.
+
+Usage: python benchmarks/bench_shared_state.py [sessions] [catches_per_session]
+"""
+import os
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, datetime, time as clock
+
+from synthetic import EVENTS, synthetic_catches
+
+from catch_store import CatchStore
+from event_engine import EventEngine
+from leaderboard import Leaderboard
+from shared_state import SharedState
+from user_repository import UserRepository
+
+
+def main():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    per_session = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    event = EVENTS[0]
+    today = date.today()
+    # Every catch is submitted at noon, inside the day's window
+    noon = datetime.combine(today, clock(12))
+    events = EventEngine()
+    events.add_event(event, "", start=today, end=today)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        shared = SharedState(
+            users=UserRepository(),
+            catch_store=CatchStore(os.path.join(tmp, "catches.db")),
+            leaderboard=Leaderboard(),
+            events=events,
+        )
+        notifications = []
+        stop = threading.Event()
+
+        def watcher():
+            seen = shared.version('catches')
+            while not stop.is_set():
+                seen = shared.wait_for_change('catches', seen, timeout=0.1)
+                notifications.append(seen)
+
+        def session(i):
+            profile = {'role': "Captain", 'county': "Broward", 'bio': "", 'events': []}
+            angler = {'role': "Angler/Team", 'county': "", 'bio': "", 'events': []}
+            shared.register_user(f"captain{i}", profile)
+            shared.register_user(f"angler{i}", angler)
+            shared.register_for_event(event, f"captain{i}")
+            shared.register_for_event(event, f"angler{i}")
+            shared.check_in(event, f"angler{i}", today)
+            for catch in synthetic_catches(per_session, seed=i):
+                catch['event'] = event
+                catch['captain'] = f"captain{i}"
+                catch['angler'] = f"angler{i}"
+                shared.submit_catch(catch, at=noon)
+
+        watch = threading.Thread(target=watcher)
+        watch.start()
+        threads = [threading.Thread(target=session, args=(i,)) for i in range(sessions)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        stop.set()
+        watch.join()
+
+        expected = sessions * per_session
+        stored = shared.catch_store.count()
+        checks = {
+            "catches stored": (stored, expected),
+            "catches version": (shared.version('catches'), expected),
+            "leaderboard entries": (len(shared.leaderboard), expected),
+            "users registered": (len(shared.users), 2 * sessions),
+            "angler check-ins": (len(shared.events.checked_in(event, today)), sessions),
+            "event registrations": (len(shared.events[event]['registered_users']), 2 * sessions),
+        }
+        print(f"{sessions} sessions x {per_session} catches in {elapsed:.2f}s "
+              f"({expected / elapsed:,.0f} catches/s), "
+              f"{len(notifications)} change notifications")
+        failed = False
+        for name, (actual, wanted) in checks.items():
+            status = "ok" if actual == wanted else "LOST UPDATES"
+            failed |= actual != wanted
+            print(f"  {name}: {actual} / {wanted} {status}")
+        shared.catch_store.close()
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Captains Directory queries against the indexed user repository.
+
+Compares one directory page from UserRepository with the previous
+approach: filter every user by role and county, then find each
+captain's username by scanning all users for an equal profile.
+
+Usage: python benchmarks/bench_user_repository.py [num_users]
+"""
+import random
+import sys
+import time
+
+from synthetic import percentile
+
+from user_repository import UserRepository
+
+COUNTIES = ["Palm Beach", "Broward", "Miami-Dade"]
+BIO_WORDS = ["wahoo", "kingfish", "sailfish", "reef", "offshore", "charter", "family", "jupiter",
+             "pompano", "boynton", "lighthouse", "tuna", "mahi", "snapper", "grouper", "night"]
+
+
+def make_users(n, seed=3):
+    rng = random.Random(seed)
+    for i in range(n):
+        role = "Captain" if rng.random() < 0.3 else "Angler/Team"
+        yield f"user{i}", {
+            'password': "x",
+            'role': role,
+            'county': rng.choice(COUNTIES) if role == "Captain" else "",
+            'bio': " ".join(rng.sample(BIO_WORDS, 4)),
+        }
+
+
+def naive_directory(users, county, page_size=20):
+    captains = [u for u in users.values() if u.get('role') == "Captain"]
+    captains = [c for c in captains if c.get('county') == county]
+    # Only the first page is rendered; the old code scanned for every captain
+    return [[k for k, v in users.items() if v == c][0] for c in captains[:page_size]]
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1000)
+    return percentile(samples, 50), percentile(samples, 99)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    users = dict(make_users(n))
+
+    t0 = time.perf_counter()
+    repo = UserRepository()
+    for username, profile in users.items():
+        repo.add(username, profile)
+    print(f"indexed {n:,} users in {time.perf_counter() - t0:.2f}s")
+
+    cases = {
+        "county page": lambda: repo.directory("Captain", county="Broward"),
+        "county page 50": lambda: repo.directory("Captain", county="Broward", page=50),
+        "prefix search": lambda: repo.directory("Captain", query="wah"),
+        "multi-term search": lambda: repo.directory("Captain", county="Miami-Dade", query="reef night"),
+        "update on save": lambda: repo.update("user7", {'bio': "Wahoo and tuna out of Jupiter"}),
+    }
+    for name, fn in cases.items():
+        p50, p99 = timed(fn, 200)
+        print(f"{name:>18}: p50 {p50:.3f}ms p99 {p99:.3f}ms")
+    p50, p99 = timed(lambda: naive_directory(users, "Broward"), 3)
+    print(f"{'previous scan':>18}: p50 {p50:.1f}ms p99 {p99:.1f}ms (first page only)")
+
+
+if __name__ == "__main__":
+    main()
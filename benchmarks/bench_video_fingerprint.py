@@ -0,0 +1,90 @@
+"""Reuse checks against a season of video fingerprints.
+
+Indexes synthetic frame hashes for a season of catch videos, as on
+startup replay, then checks new submissions: fresh videos, and re-encoded copies of earlier ones
+(a few bits flipped per frame). Reports per-video check latency against
+a linear scan, plus how many copies were flagged and how many fresh
+videos were wrongly flagged. Frame hashes are random rather than decoded
+from video, so this measures the index, not ffmpeg.
+
+Usage: python benchmarks/bench_video_fingerprint.py [num_videos]
+"""
+import random
+import sys
+import time
+import tracemalloc
+
+from synthetic import percentile
+
+from media_fingerprint import FRAME_MATCH_BITS, FRAME_SAMPLES, VideoFingerprints
+
+CHECKS = 500
+
+
+def video_hashes(rng):
+    return [rng.getrandbits(64) for _ in range(FRAME_SAMPLES)]
+
+
+def reencoded(frames, rng, max_bits=5):
+    # Re-encoding nudges a few hash bits; trimming drops a frame or two
+    kept = frames[rng.randrange(0, 2):]
+    return [h ^ sum(1 << b for b in rng.sample(range(64), rng.randrange(max_bits + 1))) for h in kept]
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    rng = random.Random(42)
+    season = [video_hashes(rng) for _ in range(n)]
+
+    tracemalloc.start()
+    fingerprints = VideoFingerprints()
+    for catch_id, frames in enumerate(season[:1000], start=1):
+        fingerprints._index_frames(catch_id, 'landing_video', frames)
+    memory = tracemalloc.get_traced_memory()[0] / 1000
+    tracemalloc.stop()
+
+    fingerprints = VideoFingerprints()
+    start = time.perf_counter()
+    for catch_id, frames in enumerate(season, start=1):
+        fingerprints._index_frames(catch_id, 'landing_video', frames)
+    build = time.perf_counter() - start
+
+    copies = [reencoded(season[rng.randrange(n)], rng) for _ in range(CHECKS)]
+    fresh = [video_hashes(rng) for _ in range(CHECKS)]
+    samples = []
+    flagged = {}
+    seen = set()
+    for kind, videos in (("copy", copies), ("fresh", fresh)):
+        for frames in videos:
+            catch_id = n + 1 + len(samples)
+            t0 = time.perf_counter()
+            fingerprints._match_frames(catch_id, 'landing_video', frames)
+            samples.append((time.perf_counter() - t0) * 1000)
+        flagged_ids = {flag.catch_id for flag in fingerprints.flags()}
+        flagged[kind] = len(flagged_ids - seen)
+        seen = flagged_ids
+
+    all_frames = [h for frames in season for h in frames]
+
+    def linear_check(frames):
+        return [
+            i for i, stored in enumerate(all_frames)
+            if any((stored ^ h).bit_count() <= FRAME_MATCH_BITS for h in frames)
+        ]
+
+    linear = []
+    for frames in fresh[:5]:
+        t0 = time.perf_counter()
+        linear_check(frames)
+        linear.append((time.perf_counter() - t0) * 1000)
+
+    print(f"{n:,} videos ({n * FRAME_SAMPLES:,} frame hashes) indexed in {build:.1f}s, "
+          f"~{memory:.0f} bytes/video")
+    print(f"  check per video: p50 {percentile(samples, 50):.2f}ms p99 {percentile(samples, 99):.2f}ms "
+          f"| linear scan p50 {percentile(linear, 50):.0f}ms")
+    print(f"  re-encoded copies flagged: {flagged['copy']} / {CHECKS}, "
+          f"fresh videos flagged: {flagged['fresh']} / {CHECKS}")
+
+
+if __name__ == "__main__":
+    main()
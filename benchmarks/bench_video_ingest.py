@@ -0,0 +1,93 @@
+"""Concurrent large video uploads through the streaming ingest pipeline.
+
+Pushes several synthetic 500 MB MP4 uploads through VideoIngestor at once
+and fails if the process's peak RSS grows past a fixed cap.
+
+Usage: python benchmarks/bench_video_ingest.py [uploads] [size_mb] [rss_cap_mb]
+"""
+import os
+import resource
+import struct
+import sys
+import tempfile
+import time
+from concurrent.futures import wait
+
+import synthetic  # noqa: F401  (puts the repo root on sys.path)
+
+
+from media_ingest import BlobStore, VideoIngestor
+
+
+def mp4_header(duration_seconds, payload_size):
+    mvhd_body = struct.pack(">B3xIIII", 0, 0, 0, 1000, int(duration_seconds * 1000)) + bytes(80)
+    mvhd = struct.pack(">I4s", 8 + len(mvhd_body), b"mvhd") + mvhd_body
+    moov = struct.pack(">I4s", 8 + len(mvhd), b"moov") + mvhd
+    ftyp = struct.pack(">I4s4sI", 16, b"ftyp", b"isom", 0)
+    mdat = struct.pack(">I4sQ", 1, b"mdat", 16 + payload_size)
+    return ftyp + moov + mdat
+
+
+class SyntheticUpload:
+    """File-like MP4 upload generated on the fly, never held in memory."""
+
+    def __init__(self, size, seed):
+        self._header = mp4_header(45.0, size)
+        self._block = os.urandom(64 * 1024) + bytes([seed])
+        self._remaining = size
+        self._pos = 0
+
+    def seek(self, offset):
+        if offset != 0 or self._pos:
+            raise ValueError("synthetic uploads only rewind to the start")
+
+    def read(self, n):
+        if self._header:
+            out, self._header = self._header, b""
+            return out
+        n = min(n, self._remaining)
+        if n <= 0:
+            return b""
+        self._remaining -= n
+        self._pos += n
+        reps = n // len(self._block) + 1
+        return (self._block * reps)[:n]
+
+
+def peak_rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    uploads = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    size_mb = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    cap_mb = int(sys.argv[3]) if len(sys.argv) > 3 else 256
+
+    with tempfile.TemporaryDirectory() as tmp:
+        ingestor = VideoIngestor(BlobStore(tmp), max_workers=uploads)
+        baseline = peak_rss_mb()
+        start = time.perf_counter()
+        futures = [
+            ingestor.submit(SyntheticUpload(size_mb * 1024 * 1024, i), f"upload{i}.mp4")
+            for i in range(uploads)
+        ]
+        wait(futures)
+        elapsed = time.perf_counter() - start
+        results = [f.result() for f in futures]
+        ingestor.shutdown()
+
+    errors = [r.error for r in results if r.error]
+    growth = peak_rss_mb() - baseline
+    total_mb = uploads * size_mb
+    print(f"{uploads} x {size_mb} MB uploads in {elapsed:.2f}s ({total_mb / elapsed:,.0f} MB/s)")
+    print(f"durations: {[r.duration for r in results]}")
+    print(f"peak RSS growth {growth:.1f} MB (cap {cap_mb} MB)")
+    if errors:
+        sys.exit(f"FAIL: ingest errors {errors}")
+    if growth > cap_mb:
+        sys.exit("FAIL: peak RSS above cap")
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import os
+import random
+import sys
+from datetime import date, timedelta
+
+# Let benchmarks import the app modules from the repo root
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+EVENTS = ["Everyday Angler Charter Tournament", "Spring Kingfish Shootout", "Reef Rally"]
+DIVISIONS = ["Pelagic", "Reef"]
+SPECIES = [
+    "King Mackerel",
+    "Spanish Mackerel",
+    "Wahoo",
+    "Dolphin/Mahi Mahi",
+    "Black Fin Tuna",
+    "Other - Captain's Choice Award Entry",
+]
+LOCATIONS = [f"Weigh-In Location {i}" for i in range(38)]
+SEASON_START = date(2026, 2, 1)
+
+
+def synthetic_catches(n, captains=2000, anglers=20000, seed=42):
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield {
+            'event': rng.choice(EVENTS),
+            'captain': f"captain{rng.randrange(captains)}",
+            'angler': f"angler{rng.randrange(anglers)}",
+            'division': rng.choice(DIVISIONS),
+            'species': rng.choice(SPECIES),
+            'weight': round(rng.uniform(1.0, 80.0), 2),
+            'weigh_in': rng.choice(LOCATIONS),
+            'landing_video': "landing.mp4",
+            'weighin_video': "weighin.mp4",
+            'date': (SEASON_START + timedelta(days=rng.randrange(300))).isoformat(),
+        }
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
@@ -0,0 +1,103 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from catch_store import CATCH_COLUMNS
+
+EXPORT_CHUNK_SIZE = 50000
+IMPORT_CHUNK_SIZE = 50000
+
+EXPORT_COLUMNS = ['id'] + CATCH_COLUMNS + ['disqualified']
+IMPORT_COLUMNS = CATCH_COLUMNS + ['disqualified']
+
+CATCH_SCHEMA = pa.schema([
+    ('id', pa.int64()),
+    ('event', pa.string()),
+    ('captain', pa.string()),
+    ('angler', pa.string()),
+    ('division', pa.string()),
+    ('species', pa.string()),
+    ('weight', pa.float64()),
+    ('weigh_in', pa.string()),
+    ('landing_video', pa.string()),
+    ('weighin_video', pa.string()),
+    ('date', pa.string()),
+    ('disqualified', pa.int64()),
+])
+
+
+def catch_chunks(store, chunk_size=EXPORT_CHUNK_SIZE, **filters):
+    """DataFrames of matching catches, one per store chunk.
+
+    filters are event, division, start_date and end_date (ISO dates).
+    """
+    for rows in store.iter_chunks(chunk_size, **filters):
+        yield pd.DataFrame.from_records(rows, columns=EXPORT_COLUMNS)
+
+
+def export_catches_csv(store, out, chunk_size=EXPORT_CHUNK_SIZE, **filters):
+    """Stream matching catches to a CSV path or text file; returns rows written."""
+    written = 0
+    if isinstance(out, str):
+        with open(out, "w", newline="", encoding="utf-8") as f:
+            return export_catches_csv(store, f, chunk_size, **filters)
+    for df in catch_chunks(store, chunk_size, **filters):
+        df.to_csv(out, header=written == 0, index=False)
+        written += len(df)
+    if written == 0:
+        pd.DataFrame(columns=EXPORT_COLUMNS).to_csv(out, index=False)
+    return written
+
+
+def export_catches_parquet(store, out, chunk_size=EXPORT_CHUNK_SIZE, **filters):
+    """Stream matching catches to Parquet, one row group per chunk."""
+    written = 0
+    with pq.ParquetWriter(out, CATCH_SCHEMA) as writer:
+        for df in catch_chunks(store, chunk_size, **filters):
+            writer.write_table(pa.Table.from_pandas(df, schema=CATCH_SCHEMA, preserve_index=False))
+            written += len(df)
+    return written
+
+
+def _insert_frames(store, frames):
+    imported = 0
+    for df in frames:
+        if 'disqualified' not in df:
+            df['disqualified'] = 0
+        df = df[IMPORT_COLUMNS].astype({'weight': float, 'disqualified': int})
+        df['date'] = df['date'].astype(str)
+        # itertuples(name=None) hands plain tuples straight to executemany
+        store.add_rows(df.itertuples(index=False, name=None), IMPORT_COLUMNS)
+        imported += len(df)
+    return imported
+
+
+def import_catches_csv(store, path, chunk_size=IMPORT_CHUNK_SIZE):
+    """Bulk-load catches from a CSV export; ids are reassigned by the store."""
+    frames = pd.read_csv(path, chunksize=chunk_size, dtype={'date': str}, keep_default_na=False)
+    return _insert_frames(store, frames)
+
+
+def import_catches_parquet(store, path, chunk_size=IMPORT_CHUNK_SIZE):
+    parquet = pq.ParquetFile(path)
+    frames = (batch.to_pandas() for batch in parquet.iter_batches(batch_size=chunk_size))
+    return _insert_frames(store, frames)
+
+
+def users_frame(users, usernames):
+    """Profiles as a DataFrame, without password hashes or pictures."""
+    records = []
+    for username in usernames:
+        profile = users.get(username, {})
+        record = {k: v for k, v in profile.items() if k not in ('password', 'picture', 'events')}
+        record['username'] = username
+        record['events'] = ";".join(profile.get('events', []))
+        records.append(record)
+    return pd.DataFrame.from_records(records)
+
+
+def event_registrations_frame(events):
+    return pd.DataFrame(
+        [(name, username) for name, event in events.items() for username in event['registered_users']],
+        columns=['event', 'username'],
+    )
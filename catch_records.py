@@ -0,0 +1,225 @@
+import struct
+import threading
+from array import array
+from bisect import bisect_left
+from collections.abc import Mapping
+from datetime import date, timedelta
+
+from constants import DIVISIONS, SPECIES_OPTIONS, WEIGH_IN_LOCATIONS
+
+# Fields a CatchView exposes: a catch_store row minus the video blob ids,
+# which standings never read
+CATCH_FIELDS = (
+    'id',
+    'event',
+    'captain',
+    'angler',
+    'division',
+    'species',
+    'weight',
+    'weigh_in',
+    'date',
+    'disqualified',
+)
+
+EPOCH = date(1970, 1, 1)
+EPOCH_ORDINAL = EPOCH.toordinal()
+
+
+class Interner:
+    """Two-way mapping between strings and small integer codes.
+
+    Seeded vocabularies keep stable codes; anything else is appended.
+    """
+
+    def __init__(self, values=()):
+        self.values = []
+        self._codes = {}
+        for value in values:
+            self.code(value)
+
+    def lookup(self, value):
+        """The code of value, or None if it hasn't been interned."""
+        return self._codes.get(value)
+
+    def code(self, value):
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+    def __getitem__(self, code):
+        return self.values[code]
+
+    def __len__(self):
+        return len(self.values)
+
+
+def pack_date(iso_date):
+    return date.fromisoformat(iso_date).toordinal() - EPOCH_ORDINAL
+
+
+def unpack_date(days):
+    return (EPOCH + timedelta(days=days)).isoformat()
+
+
+class CatchTable:
+    """Append-only, array-backed catch records in ascending id order.
+
+    Each catch costs about 45 bytes: names and event are interned codes,
+    species/location/division are seeded codes, the date is days since
+    1970 and the weight is float32. Rows are read back through CatchView,
+    a read-only mapping with the keys in CATCH_FIELDS.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.names = Interner()
+        self.events = Interner()
+        self.divisions = Interner(DIVISIONS)
+        self.species = Interner(SPECIES_OPTIONS)
+        self.locations = Interner(WEIGH_IN_LOCATIONS)
+        self._columns = {
+            'id': array('q'),
+            'event': array('H'),
+            'captain': array('I'),
+            'angler': array('I'),
+            'division': array('H'),
+            'species': array('H'),
+            'weight': array('f'),
+            'weigh_in': array('H'),
+            'date': array('i'),
+            'disqualified': array('B'),
+        }
+        self._row_format = struct.Struct("=" + "".join(column.typecode for column in self._columns.values()))
+        self._decoders = {
+            'event': self.events,
+            'captain': self.names,
+            'angler': self.names,
+            'division': self.divisions,
+            'species': self.species,
+            'weigh_in': self.locations,
+        }
+
+    def __len__(self):
+        return len(self._columns['id'])
+
+    def _encode(self, catch, catch_id):
+        # New strings get the codes interning would give them, but are only
+        # returned, so a row that doesn't fit leaves the interners unchanged
+        pending = {}  # interner -> {new value: code}
+
+        def code(interner, value):
+            existing = interner.lookup(value)
+            if existing is not None:
+                return existing
+            added = pending.setdefault(interner, {})
+            return added.setdefault(value, len(interner) + len(added))
+
+        row = (
+            catch_id or 0,
+            code(self.events, catch['event']),
+            code(self.names, catch['captain']),
+            code(self.names, catch['angler']),
+            code(self.divisions, catch['division']),
+            code(self.species, catch['species']),
+            float(catch['weight']),
+            code(self.locations, catch['weigh_in']),
+            pack_date(str(catch['date'])),
+            1 if catch.get('disqualified') else 0,
+        )
+        try:
+            # Range-checks every value against its column's type
+            self._row_format.pack(*row)
+        except (struct.error, OverflowError) as e:
+            label = f"catch {catch_id}" if catch_id else "catch"
+            raise ValueError(f"{label} does not fit the table: {e}") from None
+        return row, pending
+
+    def check(self, catch):
+        """Raise ValueError if append would reject catch, storing nothing."""
+        with self._lock:
+            self._encode(catch, catch.get('id'))
+
+    def append(self, catch):
+        """Store a catch dict with an id above every stored id; returns its row.
+
+        A catch that doesn't fit raises ValueError and stores nothing.
+        """
+        with self._lock:
+            ids = self._columns['id']
+            if ids and catch['id'] <= ids[-1]:
+                raise ValueError(f"catch id {catch['id']} is not above {ids[-1]}")
+            row, pending = self._encode(catch, catch['id'])
+            for interner, added in pending.items():
+                for value in added:
+                    interner.code(value)
+            for column, value in zip(self._columns.values(), row):
+                column.append(value)
+            return len(ids) - 1
+
+    def row_of(self, catch_id):
+        """Row index of catch_id, or None; a binary search over the ids."""
+        ids = self._columns['id']
+        row = bisect_left(ids, catch_id)
+        return row if row < len(ids) and ids[row] == catch_id else None
+
+    def __contains__(self, catch_id):
+        return self.row_of(catch_id) is not None
+
+    def get(self, catch_id, default=None):
+        row = self.row_of(catch_id)
+        return default if row is None else CatchView(self, row)
+
+    def __getitem__(self, row):
+        if not -len(self) <= row < len(self):
+            raise IndexError(row)
+        return CatchView(self, row % len(self))
+
+    def __iter__(self):
+        for row in range(len(self)):
+            yield CatchView(self, row)
+
+    def value(self, row, field):
+        raw = self._columns[field][row]
+        decoder = self._decoders.get(field)
+        if decoder is not None:
+            return decoder.values[raw]
+        if field == 'date':
+            return unpack_date(raw)
+        if field == 'weight':
+            # Weights are entered to the hundredth, well within float32
+            return round(raw, 2)
+        return raw
+
+    def values(self, row, fields):
+        """Decoded values of several fields of one row, as a tuple."""
+        return tuple(self.value(row, field) for field in fields)
+
+    def set_disqualified(self, row, disqualified=True):
+        self._columns['disqualified'][row] = 1 if disqualified else 0
+
+
+class CatchView(Mapping):
+    """Read-only dict-like view of one CatchTable row; decodes on access."""
+
+    __slots__ = ('_table', '_row')
+
+    def __init__(self, table, row):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, field):
+        if field not in CATCH_FIELDS:
+            raise KeyError(field)
+        return self._table.value(self._row, field)
+
+    def __iter__(self):
+        return iter(CATCH_FIELDS)
+
+    def __len__(self):
+        return len(CATCH_FIELDS)
+
+    def __repr__(self):
+        return f"CatchView({dict(self)!r})"
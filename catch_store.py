@@ -0,0 +1,150 @@
+import os
+import sqlite3
+import threading
+
+# Columns of a catch record, in insert order
+CATCH_COLUMNS = [
+    'event',
+    'captain',
+    'angler',
+    'division',
+    'species',
+    'weight',
+    'weigh_in',
+    'landing_video',
+    'weighin_video',
+    'date',
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS catches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    event TEXT NOT NULL,
+    captain TEXT NOT NULL,
+    angler TEXT NOT NULL,
+    division TEXT NOT NULL,
+    species TEXT NOT NULL,
+    weight REAL NOT NULL,
+    weigh_in TEXT NOT NULL,
+    landing_video TEXT NOT NULL,
+    weighin_video TEXT NOT NULL,
+    date TEXT NOT NULL,
+    disqualified INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_catches_event_division_species_date
+    ON catches (event, division, species, date);
+CREATE INDEX IF NOT EXISTS idx_catches_captain ON catches (captain);
+CREATE INDEX IF NOT EXISTS idx_catches_angler ON catches (angler);
+"""
+
+
+class CatchStore:
+    """SQLite-backed catch storage shared by every session of the app."""
+
+    def __init__(self, path):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    def add(self, catch):
+        values = [catch[col] for col in CATCH_COLUMNS]
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                f"INSERT INTO catches ({', '.join(CATCH_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(CATCH_COLUMNS))})",
+                values,
+            )
+        return cur.lastrowid
+
+    def add_many(self, catches):
+        self.add_rows([catch[col] for col in CATCH_COLUMNS] for catch in catches)
+
+    def add_rows(self, rows, columns=CATCH_COLUMNS):
+        # rows are sequences in the order of columns
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT INTO catches ({', '.join(columns)}) "
+                f"VALUES ({', '.join('?' * len(columns))})",
+                rows,
+            )
+
+    def get(self, catch_id):
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM catches WHERE id = ?", (catch_id,)).fetchone()
+        return dict(row) if row else None
+
+    def latest(self, limit=25):
+        return self.page(None, limit)
+
+    def page(self, before_id=None, limit=25):
+        # Keyset pagination: walks the primary key backwards from before_id,
+        # so cost depends on limit, not table size
+        with self._lock:
+            if before_id is None:
+                rows = self._conn.execute(
+                    "SELECT * FROM catches ORDER BY id DESC LIMIT ?", (limit,)
+                ).fetchall()
+            else:
+                rows = self._conn.execute(
+                    "SELECT * FROM catches WHERE id < ? ORDER BY id DESC LIMIT ?",
+                    (before_id, limit),
+                ).fetchall()
+        return [dict(row) for row in rows]
+
+    def latest_id(self):
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(id) FROM catches").fetchone()
+        return row[0] or 0
+
+    def iter_chunks(self, chunk_size=10000, event=None, division=None, start_date=None, end_date=None):
+        """Matching rows in id order, one list of sqlite3.Row per chunk.
+
+        Keyset-paginated on id, and the lock is released between chunks so
+        long exports never block catch submissions.
+        """
+        filters, params = ["id > ?"], []
+        for clause, value in (
+            ("event = ?", event),
+            ("division = ?", division),
+            ("date >= ?", start_date),
+            ("date <= ?", end_date),
+        ):
+            if value is not None:
+                filters.append(clause)
+                params.append(value)
+        query = f"SELECT * FROM catches WHERE {' AND '.join(filters)} ORDER BY id LIMIT ?"
+        last_id = 0
+        while True:
+            with self._lock:
+                rows = self._conn.execute(query, (last_id, *params, chunk_size)).fetchall()
+            if not rows:
+                return
+            yield rows
+            last_id = rows[-1]['id']
+
+    def iter_catches(self, chunk_size=10000):
+        for rows in self.iter_chunks(chunk_size):
+            for row in rows:
+                yield dict(row)
+
+    def disqualify(self, catch_id):
+        with self._lock, self._conn:
+            cur = self._conn.execute(
+                "UPDATE catches SET disqualified = 1 WHERE id = ? AND disqualified = 0",
+                (catch_id,),
+            )
+        return cur.rowcount == 1
+
+    def count(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM catches").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
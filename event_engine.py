@@ -0,0 +1,230 @@
+import hashlib
+import threading
+from collections import defaultdict
+from collections.abc import Mapping
+from datetime import date, datetime, time, timedelta
+
+from name_index import SEARCH_LIMIT, NameIndex
+
+WRISTBAND_COLORS = ["Red", "Blue", "Green", "Yellow", "Orange", "Purple", "Pink", "White"]
+
+# Default daily catch acceptance window
+DEFAULT_HOURS = (time(5, 0), time(21, 0))
+
+
+class CatchRejected(ValueError):
+    pass
+
+
+class IntervalIndex:
+    """Centered interval tree over half-open [start, end) intervals.
+
+    at(point) costs O(log n + matches). The tree is rebuilt lazily on the
+    first query after an add, since intervals are added in bulk when an
+    event is scheduled and queried on every submission.
+    """
+
+    def __init__(self):
+        self._intervals = []
+        self._root = None
+        self._dirty = False
+
+    def __len__(self):
+        return len(self._intervals)
+
+    def add(self, start, end, value):
+        if start < end:
+            self._intervals.append((start, end, value))
+            self._dirty = True
+
+    @staticmethod
+    def _build(intervals):
+        if not intervals:
+            return None
+        starts = sorted(start for start, _, _ in intervals)
+        center = starts[len(starts) // 2]
+        left, right, here = [], [], []
+        for interval in intervals:
+            if interval[1] <= center:
+                left.append(interval)
+            elif interval[0] > center:
+                right.append(interval)
+            else:
+                here.append(interval)
+        by_start = sorted(here, key=lambda iv: iv[0])
+        by_end = sorted(here, key=lambda iv: iv[1], reverse=True)
+        return (center, by_start, by_end, IntervalIndex._build(left), IntervalIndex._build(right))
+
+    def at(self, point):
+        """Values of every interval containing point."""
+        if self._dirty:
+            self._root = self._build(self._intervals)
+            self._dirty = False
+        found = []
+        node = self._root
+        while node is not None:
+            center, by_start, by_end, left, right = node
+            if point < center:
+                for start, _, value in by_start:
+                    if start > point:
+                        break
+                    found.append(value)
+                node = left
+            else:
+                for _, end, value in by_end:
+                    if end <= point:
+                        break
+                    found.append(value)
+                node = right
+        return found
+
+
+def wristband_colors(name, days, secret_key=b""):
+    """One color per day, never the same two days running.
+
+    Each day steps a keyed-hash amount around the palette, so colors can't
+    be predicted from the event name alone when secret_key is set.
+    """
+    colors = []
+    index = None
+    for day in days:
+        digest = hashlib.blake2b(f"{name}:{day.isoformat()}".encode(), key=secret_key[:64], digest_size=8)
+        step = int.from_bytes(digest.digest(), "big")
+        if index is None:
+            index = step % len(WRISTBAND_COLORS)
+        else:
+            index = (index + 1 + step % (len(WRISTBAND_COLORS) - 1)) % len(WRISTBAND_COLORS)
+        colors.append(WRISTBAND_COLORS[index])
+    return colors
+
+
+def _display_date(day):
+    return f"{day:%B} {day.day}, {day.year}"
+
+
+class EventEngine(Mapping):
+    """Tournaments, their daily acceptance windows and angler check-ins.
+
+    Maps event name -> event dict. Each tournament day gets its own
+    [open, close) window in an interval index, so "which events accept
+    catches now" is a stabbing query. Check-ins are kept per (event, day)
+    in a searchable NameIndex and per (angler, day) in a set, so the
+    Submit Catch angler search and "is this angler checked in today" never
+    scan every angler.
+    """
+
+    def __init__(self, secret_key=b""):
+        self._secret_key = secret_key
+        self._events = {}
+        self._lock = threading.Lock()
+        self._windows = IntervalIndex()
+        self._seasons = IntervalIndex()
+        self._day_windows = {}  # (event, day) -> (open, close)
+        self._colors = {}  # (event, day) -> wristband color
+        self._checked_in = defaultdict(NameIndex)  # (event, day) -> anglers, in check-in order
+        self._angler_events = defaultdict(set)  # (angler, day) -> events
+
+    def __getitem__(self, name):
+        return self._events[name]
+
+    def __iter__(self):
+        return iter(self._events)
+
+    def __len__(self):
+        return len(self._events)
+
+    def add_event(self, name, description, start, end, hours=DEFAULT_HOURS, days=None):
+        """Schedule a tournament running from start to end (dates, inclusive).
+
+        Catches are accepted between hours=(open, close) on each day, or
+        only on `days` when given (e.g. the three days of a derby).
+        """
+        if days is None:
+            days = [start + timedelta(days=i) for i in range((end - start).days + 1)]
+        days = sorted(days)
+        event = {
+            'description': description,
+            'start': _display_date(start),
+            'end': _display_date(end),
+            'start_date': start,
+            'end_date': end,
+            'hours': hours,
+            'registered_users': {},  # insertion-ordered set
+        }
+        colors = wristband_colors(name, days, self._secret_key)
+        with self._lock:
+            if name in self._events:
+                raise KeyError(f"Event {name!r} already exists")
+            self._events[name] = event
+            self._seasons.add(start, end + timedelta(days=1), name)
+            for day, color in zip(days, colors):
+                window = (datetime.combine(day, hours[0]), datetime.combine(day, hours[1]))
+                self._day_windows[(name, day)] = window
+                self._colors[(name, day)] = color
+                self._windows.add(*window, name)
+        return event
+
+    def events_on(self, day):
+        """Events whose season includes day."""
+        with self._lock:
+            return sorted(self._seasons.at(day))
+
+    def registered_events(self, username):
+        """Events username is registered for, in the order they were added."""
+        with self._lock:
+            return [name for name, event in self._events.items() if username in event['registered_users']]
+
+    def open_events(self, at=None):
+        """Events accepting catches at the given datetime (default now)."""
+        with self._lock:
+            return sorted(self._windows.at(at or datetime.now()))
+
+    def window(self, name, day):
+        return self._day_windows.get((name, day))
+
+    def wristband_color(self, name, day=None):
+        return self._colors.get((name, day or date.today()))
+
+    def check_in(self, name, angler, day=None):
+        """Check angler in to event for day; False if already checked in.
+
+        Raises ValueError if the angler isn't registered for the event or it
+        isn't running that day.
+        """
+        day = day or date.today()
+        if angler not in self._events[name]['registered_users']:
+            raise ValueError(f"{angler} is not registered for {name}")
+        if (name, day) not in self._day_windows:
+            raise ValueError(f"{name} is not running on {_display_date(day)}")
+        with self._lock:
+            if not self._checked_in[(name, day)].add(angler):
+                return False
+            self._angler_events[(angler, day)].add(name)
+        return True
+
+    def checked_in(self, name, day=None):
+        """Anglers checked in to event for day, in check-in order."""
+        return list(self._checked_in.get((name, day or date.today()), ()))
+
+    def search_checked_in(self, name, query, day=None, limit=SEARCH_LIMIT):
+        """Top matches for query among anglers checked in to event for day."""
+        anglers = self._checked_in.get((name, day or date.today()))
+        return anglers.search(query, limit) if anglers else []
+
+    def angler_events(self, angler, day=None):
+        """Events angler is checked in to for day."""
+        return self._angler_events.get((angler, day or date.today()), set())
+
+    def catch_error(self, name, angler, at=None):
+        """Why a catch can't be accepted at datetime at, or None if it can."""
+        at = at or datetime.now()
+        if name not in self._events:
+            return f"Unknown event {name!r}"
+        window = self._day_windows.get((name, at.date()))
+        if window is None:
+            return f"{name} is not running today"
+        if not window[0] <= at < window[1]:
+            return f"{name} accepts catches from {window[0]:%H:%M} to {window[1]:%H:%M}"
+        if name not in self.angler_events(angler, at.date()):
+            return f"{angler} has not checked in to {name} today"
+        return None
@@ -0,0 +1,67 @@
+import io
+
+from PIL import Image, UnidentifiedImageError
+
+# EXIF Orientation tag id, so no scan of ExifTags.TAGS is needed
+ORIENTATION_TAG = 0x0112
+
+# Transposes that bring each EXIF orientation back to upright
+ORIENTATION_TRANSPOSES = {
+    2: Image.Transpose.FLIP_LEFT_RIGHT,
+    3: Image.Transpose.ROTATE_180,
+    4: Image.Transpose.FLIP_TOP_BOTTOM,
+    5: Image.Transpose.TRANSPOSE,
+    6: Image.Transpose.ROTATE_270,
+    7: Image.Transpose.TRANSVERSE,
+    8: Image.Transpose.ROTATE_90,
+}
+
+MAX_PICTURE_SIZE = 800
+
+
+class ImageError(ValueError):
+    pass
+
+
+def read_orientation(image):
+    """EXIF orientation (1-8) of an opened image; reads headers only."""
+    try:
+        orientation = image.getexif().get(ORIENTATION_TAG, 1)
+    except (OSError, SyntaxError, ValueError):
+        return 1
+    return orientation if orientation in range(1, 9) else 1
+
+
+def open_upright(fileobj, max_size=None):
+    """Open an image, decode it at reduced size when possible, and fix rotation.
+
+    With max_size set, JPEGs are decoded straight to the smallest DCT scale
+    that still covers max_size, so a 12 MP photo never materialises in full.
+    """
+    try:
+        image = Image.open(fileobj)
+        orientation = read_orientation(image)
+        scale = max_size / max(image.size) if max_size else 1
+        if scale < 1:
+            # draft() keeps at least the requested size, so ask for the
+            # aspect-preserving target rather than the square bounding box
+            target = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+            image.draft("RGB", target)
+            image.thumbnail(target, reducing_gap=3.0)
+        else:
+            image.load()
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError) as e:
+        raise ImageError(f"Could not read image: {e}") from e
+    if orientation in ORIENTATION_TRANSPOSES:
+        image = image.transpose(ORIENTATION_TRANSPOSES[orientation])
+    return image
+
+
+def normalize_image(fileobj, max_size=MAX_PICTURE_SIZE, quality=90):
+    """Upright JPEG bytes no larger than max_size on either side."""
+    image = open_upright(fileobj, max_size)
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+    out = io.BytesIO()
+    image.save(out, "JPEG", quality=quality, optimize=True)
+    return out.getvalue()
@@ -0,0 +1,138 @@
+import threading
+from bisect import bisect_left, insort
+from collections import defaultdict
+
+from catch_records import CatchTable
+
+LEADERBOARD_SIZE = 10
+
+ENTRY_FIELDS = ('event', 'division', 'species', 'angler', 'captain', 'weight')
+DESCRIBE_FIELDS = ('angler', 'captain', 'weight')
+
+
+class Ranking:
+    """Totals per name kept in descending order, so top(k) is a slice."""
+
+    def __init__(self):
+        self.totals = {}
+        self._counts = {}
+        self._order = []  # (-total, name), ascending
+
+    def add(self, name, delta, count=1):
+        old = self.totals.get(name)
+        if old is not None:
+            del self._order[bisect_left(self._order, (-old, name))]
+        remaining = self._counts.get(name, 0) + count
+        if remaining > 0:
+            new = (old or 0.0) + delta
+            self.totals[name] = new
+            self._counts[name] = remaining
+            insort(self._order, (-new, name))
+        else:
+            self.totals.pop(name, None)
+            self._counts.pop(name, None)
+
+    def top(self, k=LEADERBOARD_SIZE):
+        return [(name, -neg_total) for neg_total, name in self._order[:k]]
+
+    def __len__(self):
+        return len(self._order)
+
+
+class Standings:
+    """Standings for one event/division/species."""
+
+    def __init__(self):
+        self._fish = []  # (-weight, catch_id), ascending
+        self.anglers = Ranking()
+        self.captains = Ranking()
+
+    def add(self, catch_id, angler, captain, weight):
+        insort(self._fish, (-weight, catch_id))
+        self.anglers.add(angler, weight)
+        self.captains.add(captain, weight)
+
+    def remove(self, catch_id, angler, captain, weight):
+        del self._fish[bisect_left(self._fish, (-weight, catch_id))]
+        self.anglers.add(angler, -weight, count=-1)
+        self.captains.add(captain, -weight, count=-1)
+
+    def heaviest(self, k=LEADERBOARD_SIZE):
+        return [(catch_id, -neg_weight) for neg_weight, catch_id in self._fish[:k]]
+
+
+class Leaderboard:
+    """Incrementally maintained standings by event, division and species.
+
+    Accepting or disqualifying a catch touches only the standings it belongs
+    to, and every read is a slice of an already sorted list. Catches are
+    kept in a compact CatchTable rather than as one dict per catch.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._standings = defaultdict(Standings)
+        self._catches = CatchTable()
+        self._active = 0
+
+    @classmethod
+    def from_catches(cls, catches):
+        leaderboard = cls()
+        for catch in catches:
+            leaderboard.add(catch)
+        return leaderboard
+
+    def check(self, catch):
+        """Raise ValueError if catch can't be stored, without adding it."""
+        self._catches.check(catch)
+
+    def add(self, catch):
+        if catch.get('disqualified'):
+            return
+        with self._lock:
+            if catch['id'] in self._catches:
+                return
+            row = self._catches.append(catch)
+            key = (catch['event'], catch['division'], catch['species'])
+            # The stored float32 weight, so disqualify removes the same value
+            weight = self._catches.value(row, 'weight')
+            self._standings[key].add(catch['id'], catch['angler'], catch['captain'], weight)
+            self._active += 1
+
+    def __len__(self):
+        return self._active
+
+    def disqualify(self, catch_id):
+        with self._lock:
+            row = self._catches.row_of(catch_id)
+            if row is None or self._catches.value(row, 'disqualified'):
+                return False
+            event, division, species, *entry = self._catches.values(row, ENTRY_FIELDS)
+            self._standings[(event, division, species)].remove(catch_id, *entry)
+            self._catches.set_disqualified(row)
+            self._active -= 1
+        return True
+
+    def _describe(self, catch_id):
+        values = self._catches.values(self._catches.row_of(catch_id), DESCRIBE_FIELDS)
+        return dict(zip(DESCRIBE_FIELDS, values))
+
+    def heaviest_fish(self, event, division, species, k=LEADERBOARD_SIZE):
+        with self._lock:
+            standings = self._standings.get((event, division, species))
+            if standings is None:
+                return []
+            return [
+                dict(self._describe(catch_id), id=catch_id)
+                for catch_id, _ in standings.heaviest(k)
+            ]
+
+    def top_anglers(self, event, division, species, k=LEADERBOARD_SIZE):
+        with self._lock:
+            standings = self._standings.get((event, division, species))
+            return standings.anglers.top(k) if standings else []
+
+    def top_captains(self, event, division, species, k=LEADERBOARD_SIZE):
+        with self._lock:
+            standings = self._standings.get((event, division, species))
+            return standings.captains.top(k) if standings else []
@@ -0,0 +1,186 @@
+import io
+import multiprocessing
+import os
+import shutil
+import subprocess
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+from image_normalize import open_upright
+
+PROFILE_SIZES = (64, 150, 400)
+POSTER_WIDTH = 320
+CACHE_BUDGET_BYTES = 256 * 1024 * 1024
+
+
+class DerivativeCache:
+    """On-disk cache with least-recently-used eviction under a size budget.
+
+    Recency is kept in memory and written back as file mtimes on eviction
+    and flush(), so it survives restarts without a write on every hit.
+    """
+
+    def __init__(self, root, budget_bytes=CACHE_BUDGET_BYTES):
+        self.root = root
+        self.budget_bytes = budget_bytes
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+        entries = sorted(
+            (entry for entry in os.scandir(root) if entry.is_file()),
+            key=lambda entry: entry.stat().st_mtime_ns,
+        )
+        # key -> size, least recently used first
+        self._sizes = OrderedDict((entry.name, entry.stat().st_size) for entry in entries)
+        self._touched = set()  # keys used since mtimes were last written
+        self._used = sum(self._sizes.values())
+
+    def path(self, key):
+        return os.path.join(self.root, key)
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._sizes:
+                return None
+            self._sizes.move_to_end(key)
+            self._touched.add(key)
+        return self.path(key)
+
+    def put(self, key, data):
+        tmp_path = self.path(f".{key}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, self.path(key))
+        with self._lock:
+            self._used += len(data) - self._sizes.get(key, 0)
+            self._sizes[key] = len(data)
+            self._sizes.move_to_end(key)
+            if self._used > self.budget_bytes:
+                self._evict()
+
+    def flush(self):
+        """Write in-memory recency back to file mtimes."""
+        with self._lock:
+            self._write_recency()
+
+    def _evict(self):
+        # Drop least recently used files until back under 90% of the budget
+        target = self.budget_bytes * 0.9
+        while self._sizes and self._used > target:
+            key, size = self._sizes.popitem(last=False)
+            self._touched.discard(key)
+            try:
+                os.unlink(self.path(key))
+            except FileNotFoundError:
+                pass
+            self._used -= size
+        self._write_recency()
+
+    def _write_recency(self):
+        # From the oldest key used since the last write onward, give files
+        # increasing mtimes in recency order
+        keys = list(self._sizes)
+        first = next((i for i, key in enumerate(keys) if key in self._touched), len(keys))
+        now = time.time_ns()
+        for i, key in enumerate(keys[first:]):
+            try:
+                os.utime(self.path(key), ns=(now + i, now + i))
+            except FileNotFoundError:
+                pass
+        self._touched.clear()
+
+    def __contains__(self, key):
+        return key in self._sizes
+
+
+def make_profile_variants(image_path, sizes=PROFILE_SIZES):
+    """JPEG thumbnails of a profile picture, one bounded to each size."""
+    variants = {}
+    image = open_upright(image_path, max(sizes)).convert("RGB")
+    for size in sorted(sizes, reverse=True):
+        image.thumbnail((size, size))
+        out = io.BytesIO()
+        image.save(out, "JPEG", quality=85, optimize=True)
+        variants[size] = out.getvalue()
+    return variants
+
+
+def make_video_poster(video_path, width=POSTER_WIDTH):
+    """Poster JPEG from the first second of a video, or None without ffmpeg."""
+    if not shutil.which("ffmpeg"):
+        return None
+    try:
+        return subprocess.run(
+            [
+                "ffmpeg", "-v", "error", "-ss", "1", "-i", video_path,
+                "-frames:v", "1", "-vf", f"scale={width}:-2",
+                "-f", "image2pipe", "-vcodec", "mjpeg", "-",
+            ],
+            capture_output=True, check=True, timeout=60,
+        ).stdout or None
+    except subprocess.SubprocessError:
+        return None
+
+
+def profile_key(blob_id, size):
+    return f"{os.path.splitext(blob_id)[0]}_{size}.jpg"
+
+
+def poster_key(blob_id):
+    return f"{os.path.splitext(blob_id)[0]}_poster.jpg"
+
+
+class MediaDerivatives:
+    """Generates thumbnails and video posters in a process pool.
+
+    Requests return immediately; finished derivatives land in the cache and
+    callers fall back to the original until then.
+    """
+
+    def __init__(self, cache, max_workers=2):
+        self.cache = cache
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._pool = ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+        )
+
+    def _submit(self, key, store, fn, *args):
+        with self._lock:
+            if key in self._pending or key in self.cache:
+                return None
+            self._pending.add(key)
+        future = self._pool.submit(fn, *args)
+        future.add_done_callback(lambda f: self._finish(key, store, f))
+        return future
+
+    def _finish(self, key, store, future):
+        try:
+            if future.exception() is None and future.result():
+                store(future.result())
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+
+    def submit_profile_picture(self, blob_id, image_path):
+        # The largest size is written last: it marks the set as complete
+        def store(variants):
+            for size, data in sorted(variants.items()):
+                self.cache.put(profile_key(blob_id, size), data)
+        return self._submit(profile_key(blob_id, PROFILE_SIZES[-1]), store, make_profile_variants, image_path)
+
+    def submit_video_poster(self, blob_id, video_path):
+        def store(data):
+            self.cache.put(poster_key(blob_id), data)
+        return self._submit(poster_key(blob_id), store, make_video_poster, video_path)
+
+    def profile_picture(self, blob_id, size):
+        return self.cache.get(profile_key(blob_id, size))
+
+    def poster(self, blob_id):
+        return self.cache.get(poster_key(blob_id))
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True)
+        self.cache.flush()
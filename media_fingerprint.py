@@ -0,0 +1,239 @@
+import json
+import os
+import shutil
+import subprocess
+import threading
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass
+from itertools import combinations
+
+from media_ingest import probe_duration
+
+FRAME_SAMPLES = 8
+# Frames whose 64-bit difference hashes differ in at most this many bits match
+FRAME_MATCH_BITS = 8
+# Share of a video's sampled frames that must match one earlier video
+MATCH_FRACTION = 0.5
+# Bits per chunk in the Hamming index; 3 chunks keep both the probes and
+# the candidates per query small for a season of frames
+HASH_CHUNK_BITS = (22, 21, 21)
+FRAME_SIZE = (9, 8)
+
+
+@dataclass
+class ReuseFlag:
+    catch_id: int
+    video: str
+    other_catch_id: int
+    other_video: str
+    reason: str
+
+    @property
+    def key(self):
+        return (self.catch_id, self.video, self.other_catch_id, self.other_video)
+
+
+def dhash(pixels, width=FRAME_SIZE[0], height=FRAME_SIZE[1]):
+    """64-bit difference hash of a 9x8 grayscale frame."""
+    value = 0
+    for y in range(height):
+        row = pixels[y * width:(y + 1) * width]
+        for x in range(width - 1):
+            value = (value << 1) | (row[x] > row[x + 1])
+    return value
+
+
+def _informative(frame_hash):
+    # Flat frames (open water, sky, a black lens cap) hash to almost all
+    # zeros or ones and would match every other video
+    return 6 <= frame_hash.bit_count() <= 58
+
+
+def _usable(frames):
+    return [h for h in dict.fromkeys(frames) if _informative(h)]
+
+
+def sample_frame_hashes(video_path, samples=FRAME_SAMPLES):
+    """Difference hashes of frames spread across a video, or None without ffmpeg."""
+    if not shutil.which("ffmpeg"):
+        return None
+    duration = probe_duration(video_path)
+    if not duration:
+        return None
+    width, height = FRAME_SIZE
+    try:
+        raw = subprocess.run(
+            [
+                "ffmpeg", "-v", "error", "-i", video_path,
+                "-vf", f"fps={samples / duration:.6f},scale={width}:{height}:flags=area,format=gray",
+                "-frames:v", str(samples), "-f", "rawvideo", "-",
+            ],
+            capture_output=True, check=True, timeout=120,
+        ).stdout
+    except subprocess.SubprocessError:
+        return None
+    size = width * height
+    return [dhash(raw[i:i + size]) for i in range(0, len(raw) - size + 1, size)]
+
+
+class HammingIndex:
+    """64-bit hashes searchable by Hamming radius (multi-index hashing).
+
+    Each hash is split into chunks, each with its own table. Two hashes
+    within `radius` bits must agree to within radius // len(chunk_bits)
+    bits on at least one chunk, so a query probes a fixed set of nearby
+    buckets per chunk and verifies only what it finds there, rather than
+    comparing against every stored hash.
+    """
+
+    def __init__(self, radius=FRAME_MATCH_BITS, chunk_bits=HASH_CHUNK_BITS):
+        self.radius = radius
+        chunk_radius = radius // len(chunk_bits)
+        self._layout = []  # (shift, mask, probes) per chunk
+        shift = 0
+        for bits in chunk_bits:
+            probes = [
+                sum(1 << bit for bit in flipped)
+                for r in range(chunk_radius + 1)
+                for flipped in combinations(range(bits), r)
+            ]
+            self._layout.append((shift, (1 << bits) - 1, probes))
+            shift += bits
+        self._tables = [{} for _ in chunk_bits]
+        self._hashes = array('Q')
+        self.values = []
+
+    def __len__(self):
+        return len(self._hashes)
+
+    def add(self, value, ref):
+        entry = len(self._hashes)
+        self._hashes.append(value)
+        self.values.append(ref)
+        for table, (shift, mask, _) in zip(self._tables, self._layout):
+            table.setdefault((value >> shift) & mask, []).append(entry)
+
+    def search(self, value):
+        """(distance, ref) for every stored hash within radius of value."""
+        seen = set()
+        found = []
+        for table, (shift, mask, probes) in zip(self._tables, self._layout):
+            chunk = (value >> shift) & mask
+            for probe in probes:
+                for entry in table.get(chunk ^ probe, ()):
+                    if entry in seen:
+                        continue
+                    seen.add(entry)
+                    distance = (self._hashes[entry] ^ value).bit_count()
+                    if distance <= self.radius:
+                        found.append((distance, self.values[entry]))
+        return found
+
+
+class VideoFingerprints:
+    """Flags catches whose videos reuse an earlier catch's footage.
+
+    The SHA-256 in a blob id catches byte-identical files immediately.
+    Re-encoded or trimmed copies are caught by difference hashes of
+    sampled frames, computed on a worker pool so submission doesn't wait.
+    Fingerprints and flags are appended to log_path and reloaded on
+    startup without re-matching, so new videos are checked against the
+    whole season.
+    """
+
+    def __init__(self, log_path=None, max_workers=2):
+        self.log_path = log_path
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fingerprint")
+        self._by_digest = {}  # sha256 -> (catch_id, video)
+        self._frames = HammingIndex()
+        self._flags = {}
+        self._dismissed = set()
+        self.version = 0
+        if log_path and os.path.exists(log_path):
+            with open(log_path, encoding="utf-8") as f:
+                for line in f:
+                    self._replay(json.loads(line))
+
+    def _replay(self, record):
+        if 'dismiss' in record:
+            self._dismissed.add(tuple(record['dismiss']))
+        elif 'flag' in record:
+            flag = ReuseFlag(**record['flag'])
+            self._flags[flag.key] = flag
+        elif 'frames' in record:
+            self._index_frames(record['catch_id'], record['video'], _usable(record['frames']))
+        else:
+            self._by_digest.setdefault(os.path.splitext(record['blob_id'])[0], (record['catch_id'], record['video']))
+
+    def _log(self, record):
+        if self.log_path:
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+
+    def _flag(self, flag):
+        if flag.key not in self._flags:
+            self._flags[flag.key] = flag
+            self._log({'flag': asdict(flag)})
+            self.version += 1
+
+    def _match_digest(self, catch_id, video, blob_id):
+        digest = os.path.splitext(blob_id)[0]
+        first = self._by_digest.setdefault(digest, (catch_id, video))
+        if first[0] != catch_id:
+            self._flag(ReuseFlag(catch_id, video, *first, "identical video file"))
+
+    def _index_frames(self, catch_id, video, frames):
+        for frame_hash in frames:
+            self._frames.add(frame_hash, (catch_id, video))
+
+    def _match_frames(self, catch_id, video, frames):
+        matched = {}  # (other catch, video) -> indexes of our frames it matched
+        for i, frame_hash in enumerate(frames):
+            for _, other in self._frames.search(frame_hash):
+                if other[0] != catch_id:
+                    matched.setdefault(other, set()).add(i)
+        needed = min(len(frames), max(2, round(len(frames) * MATCH_FRACTION)))
+        for other, hits in matched.items():
+            if len(hits) >= needed:
+                self._flag(ReuseFlag(
+                    catch_id, video, *other, f"{len(hits)} of {len(frames)} sampled frames match",
+                ))
+        self._index_frames(catch_id, video, frames)
+
+    def submit(self, catch_id, video, blob_id, video_path):
+        """Check a catch video: the file hash now, sampled frames in the background."""
+        record = {'catch_id': catch_id, 'video': video, 'blob_id': blob_id}
+        with self._lock:
+            self._match_digest(catch_id, video, blob_id)
+            self._log(record)
+        future = self._pool.submit(sample_frame_hashes, video_path)
+        future.add_done_callback(lambda f: self._finish(record, f))
+        return future
+
+    def _finish(self, record, future):
+        frames = _usable(future.result() or []) if future.exception() is None else []
+        if not frames:
+            return
+        record = dict(record, frames=frames)
+        with self._lock:
+            self._match_frames(record['catch_id'], record['video'], record['frames'])
+            self._log(record)
+
+    def flags(self):
+        """Open reuse flags, oldest first."""
+        with self._lock:
+            return [flag for key, flag in self._flags.items() if key not in self._dismissed]
+
+    def dismiss(self, flag):
+        with self._lock:
+            if flag.key in self._dismissed:
+                return False
+            self._dismissed.add(flag.key)
+            self._log({'dismiss': list(flag.key)})
+            self.version += 1
+        return True
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,159 @@
+import hashlib
+import json
+import os
+import shutil
+import struct
+import subprocess
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+CHUNK_SIZE = 1024 * 1024
+MIN_VIDEO_SECONDS = 3.0
+VIDEO_EXTENSIONS = {".mp4", ".mov"}
+
+
+@dataclass
+class IngestResult:
+    blob_id: str = None
+    duration: float = None
+    error: str = None
+
+
+class BlobStore:
+    """Content-addressed files on disk, named by the SHA-256 of their bytes."""
+
+    def __init__(self, root):
+        self.root = root
+        self.tmp_dir = os.path.join(root, "tmp")
+        os.makedirs(self.tmp_dir, exist_ok=True)
+
+    def path(self, blob_id):
+        return os.path.join(self.root, blob_id[:2], blob_id)
+
+    def exists(self, blob_id):
+        return os.path.exists(self.path(blob_id))
+
+    def stream_to_temp(self, fileobj, chunk_size=CHUNK_SIZE):
+        # Copies in fixed-size chunks so memory stays bounded by chunk_size
+        digest = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=self.tmp_dir)
+        try:
+            with os.fdopen(fd, "wb") as out:
+                while True:
+                    chunk = fileobj.read(chunk_size)
+                    if not chunk:
+                        break
+                    digest.update(chunk)
+                    out.write(chunk)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return tmp_path, digest.hexdigest()
+
+    def put(self, fileobj, ext):
+        tmp_path, digest = self.stream_to_temp(fileobj)
+        return self.commit(tmp_path, digest + ext)
+
+    def commit(self, tmp_path, blob_id):
+        path = self.path(blob_id)
+        if os.path.exists(path):
+            os.unlink(tmp_path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+        return blob_id
+
+
+def _mp4_boxes(f, start, end):
+    offset = start
+    while offset + 8 <= end:
+        f.seek(offset)
+        size, kind = struct.unpack(">I4s", f.read(8))
+        header = 8
+        if size == 1:
+            size = struct.unpack(">Q", f.read(8))[0]
+            header = 16
+        elif size == 0:
+            size = end - offset
+        if size < header:
+            return
+        yield kind, offset + header, offset + size
+        offset += size
+
+
+def mp4_duration(path):
+    """Duration in seconds from the mvhd box of an MP4/MOV file, or None.
+
+    Only box headers are read, so this is cheap even for very large files.
+    """
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        for kind, body, box_end in _mp4_boxes(f, 0, end):
+            if kind != b"moov":
+                continue
+            for child, child_body, _ in _mp4_boxes(f, body, box_end):
+                if child != b"mvhd":
+                    continue
+                f.seek(child_body)
+                version = f.read(1)[0]
+                if version == 1:
+                    f.seek(child_body + 20)
+                    timescale, duration = struct.unpack(">IQ", f.read(12))
+                else:
+                    f.seek(child_body + 12)
+                    timescale, duration = struct.unpack(">II", f.read(8))
+                return duration / timescale if timescale else None
+    return None
+
+
+def probe_duration(path):
+    if shutil.which("ffprobe"):
+        try:
+            out = subprocess.run(
+                ["ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "json", path],
+                capture_output=True, check=True, timeout=30,
+            ).stdout
+            return float(json.loads(out)['format']['duration'])
+        except (subprocess.SubprocessError, KeyError, ValueError):
+            pass
+    try:
+        return mp4_duration(path)
+    except (OSError, struct.error, IndexError):
+        return None
+
+
+class VideoIngestor:
+    """Streams uploaded videos into the blob store on a bounded worker pool.
+
+    Each upload is copied to disk chunk by chunk while it is hashed, probed
+    for its container duration, and only then moved to its content address.
+    """
+
+    def __init__(self, blob_store, max_workers=4, min_seconds=MIN_VIDEO_SECONDS):
+        self.blobs = blob_store
+        self.min_seconds = min_seconds
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="video-ingest")
+
+    def submit(self, fileobj, name):
+        return self._pool.submit(self.ingest, fileobj, name)
+
+    def ingest(self, fileobj, name):
+        ext = os.path.splitext(name)[1].lower()
+        if ext not in VIDEO_EXTENSIONS:
+            return IngestResult(error="unsupported file type")
+        if hasattr(fileobj, "seek"):
+            fileobj.seek(0)
+        tmp_path, digest = self.blobs.stream_to_temp(fileobj)
+        duration = probe_duration(tmp_path)
+        if duration is None:
+            os.unlink(tmp_path)
+            return IngestResult(error="could not be read")
+        if duration < self.min_seconds:
+            os.unlink(tmp_path)
+            return IngestResult(duration=duration, error="too short")
+        blob_id = self.blobs.commit(tmp_path, digest + ext)
+        return IngestResult(blob_id=blob_id, duration=duration)
+
+    def shutdown(self):
+        self._pool.shutdown(wait=True)
@@ -0,0 +1,265 @@
+import heapq
+import math
+import re
+import threading
+from bisect import bisect_left
+from itertools import islice
+
+SEARCH_LIMIT = 20
+# Share of the query's trigrams a fuzzy match must contain
+FUZZY_MIN_SIMILARITY = 0.5
+# Trigram shortlist per requested match, reranked by edit distance
+FUZZY_SHORTLIST = 2
+# Above this many candidates the match threshold is raised
+FUZZY_MAX_CANDIDATES = 1000
+# Edits beyond this all rank the same, which bounds the reranking cost
+FUZZY_MAX_EDITS = 3
+# Queries up to this long are also matched by edit distance to word
+# starts, since one typo leaves them too few trigrams in common
+FUZZY_SHORT_QUERY = 9
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def normalize(text):
+    return " ".join(_WORD_RE.findall((text or "").lower()))
+
+
+def trigrams(text, trailing=True):
+    """Trigrams of each word, padded so word starts weigh the most.
+
+    trailing=False drops each word's end marker, for queries still being typed.
+    """
+    grams = set()
+    for word in text.split():
+        padded = f"  {word} " if trailing else f"  {word}"
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def edit_distance(a, b, max_distance=None):
+    """Optimal string alignment distance (adjacent swaps cost one).
+
+    With max_distance, only a band of that width is computed and any
+    larger distance is returned as max_distance + 1.
+    """
+    if max_distance is None:
+        max_distance = max(len(a), len(b))
+    far = max_distance + 1
+    if abs(len(a) - len(b)) > max_distance:
+        return far
+    previous, current = None, [min(j, far) for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        before, previous, current = previous, current, [min(i, far)] + [far] * len(b)
+        lo, hi = max(1, i - max_distance), min(len(b), i + max_distance)
+        ai = a[i - 1]
+        for j in range(lo, hi + 1):
+            # min() calls dominate this loop, so the comparisons are inline
+            value = previous[j - 1] + (ai != b[j - 1])
+            if previous[j] + 1 < value:
+                value = previous[j] + 1
+            if current[j - 1] + 1 < value:
+                value = current[j - 1] + 1
+            if i > 1 and j > 1 and ai == b[j - 2] and a[i - 2] == b[j - 1] and before[j - 2] + 1 < value:
+                value = before[j - 2] + 1
+            current[j] = value if value < far else far
+        if min(current[lo - 1:hi + 1]) > max_distance:
+            return far
+    return current[-1]
+
+
+class NameIndex:
+    """Names searchable by word prefix, falling back to trigram fuzzy matches.
+
+    Prefix matches come from a sorted list of every word-suffix of each
+    name. Each query term must start consecutive words ("jo sm" finds
+    "John Smith", as does "smi"), so a keystroke costs a bisect per
+    distinct word matching the leading terms, plus the matches returned. Fuzzy candidates come from the query's rarest
+    trigrams only, which must include any name sharing enough trigrams;
+    a short list of the best is then ranked by edit distance to the
+    name's word starts. Short queries also walk the sorted keys as a trie
+    of word starts sharing their first letter, keeping starts within an
+    edit or two. Iterates in insertion order.
+    """
+
+    def __init__(self, names=()):
+        self._lock = threading.Lock()
+        self._names = {}  # name -> trigrams, insertion ordered
+        self._keys = []  # sorted (word-suffix key, name)
+        self._pending = []  # keys added since the last sort
+        self._by_gram = {}
+        for name in names:
+            self.add(name)
+
+    def __contains__(self, name):
+        return name in self._names
+
+    def __len__(self):
+        return len(self._names)
+
+    def __iter__(self):
+        return iter(list(self._names))
+
+    def add(self, name):
+        """Index name; False if it is already indexed."""
+        key = normalize(name)
+        grams = trigrams(key)
+        with self._lock:
+            if name in self._names:
+                return False
+            self._names[name] = grams
+            words = key.split()
+            self._pending.extend((" ".join(words[i:]), name) for i in range(len(words)))
+            for gram in grams:
+                self._by_gram.setdefault(gram, set()).add(name)
+        return True
+
+    def _sorted_keys(self):
+        if self._pending:
+            # Timsort merges the pending run in O(n) instead of n insorts
+            self._keys.extend(self._pending)
+            self._keys.sort()
+            self._pending = []
+        return self._keys
+
+    def prefix(self, query, limit=SEARCH_LIMIT):
+        terms = normalize(query).split() or [""]
+        found = {}
+        with self._lock:
+            self._match_terms(self._sorted_keys(), "", terms, found, limit)
+        return list(found)
+
+    @staticmethod
+    def _match_terms(keys, head, terms, found, limit):
+        # head is the words already matched, each followed by a space. Keys
+        # sharing a head and a next word are contiguous, so each word that
+        # starts with terms[0] is matched against the rest, then skipped.
+        start = head + terms[0]
+        i = bisect_left(keys, (start,))
+        while i < len(keys) and len(found) < limit and keys[i][0].startswith(start):
+            key = keys[i][0]
+            if len(terms) == 1:
+                found[keys[i][1]] = None
+                i += 1
+                continue
+            end = key.find(" ", len(head))
+            if end < 0:
+                # A last word can't match the remaining terms
+                i += 1
+                continue
+            NameIndex._match_terms(keys, key[:end + 1], terms[1:], found, limit)
+            # "!" sorts right after " ", past every key continuing this word
+            i = bisect_left(keys, (key[:end] + "!",), i)
+
+    def fuzzy(self, query, limit=SEARCH_LIMIT, exclude=()):
+        """Names close to query despite typos, most similar first."""
+        query = normalize(query)
+        found = self._trigram_matches(query, limit, exclude)
+        if 3 <= len(query) <= FUZZY_SHORT_QUERY and len(found) < limit:
+            found += self._near_starts(query, limit - len(found), set(exclude).union(found))
+        return found
+
+    def _trigram_matches(self, query, limit, exclude):
+        grams = trigrams(query, trailing=False)
+        if len(grams) < 3:
+            # Too short to be selective; prefix search covers it
+            return []
+        needed = math.ceil(len(grams) * FUZZY_MIN_SIMILARITY)
+        with self._lock:
+            postings = sorted((self._by_gram.get(gram, ()) for gram in grams), key=len)
+            # A name sharing `needed` grams appears in one of the rarest
+            # len(grams) - needed + 1 postings. With many similar names,
+            # demand more shared grams rather than score them all.
+            while needed < len(grams) and sum(map(len, postings[:len(grams) - needed + 1])) > FUZZY_MAX_CANDIDATES:
+                needed += 1
+            candidates = set().union(*postings[:len(grams) - needed + 1])
+            if len(candidates) > FUZZY_MAX_CANDIDATES:
+                # Even the rarest trigram is common: score names holding every
+                # query trigram plus a bounded sample of the rest
+                candidates = set(postings[0]).intersection(*postings[1:]).union(
+                    islice(candidates, FUZZY_MAX_CANDIDATES)
+                )
+            scored = []
+            for name in candidates:
+                if name in exclude:
+                    continue
+                shared = len(grams & self._names[name])
+                if shared >= needed:
+                    scored.append((shared, -len(name), name))
+        shortlist = heapq.nlargest(limit * FUZZY_SHORTLIST, scored)
+        ranked = sorted(
+            (self._distance(query, name), -shared, -neg_len, name)
+            for shared, neg_len, name in shortlist
+        )
+        return [name for *_, name in ranked[:limit]]
+
+    def _near_starts(self, query, limit, exclude):
+        max_edits = max(1, len(query) // 3)
+        matches = []
+        with self._lock:
+            keys = self._sorted_keys()
+            # Rows of edit distances to query's prefixes, from "" and query[0]
+            empty, first = list(range(len(query) + 1)), [1] + list(range(len(query)))
+            self._walk_starts(keys, query, query[0], empty, first, max_edits, 0, matches)
+            found = {}
+            for _, i, end in sorted(matches):
+                for _, name in keys[i:end]:
+                    if name not in exclude:
+                        found[name] = None
+        return list(found)[:limit]
+
+    @staticmethod
+    def _walk_starts(keys, query, prefix, before, row, max_edits, lo, matches):
+        # Walks the sorted keys as a trie of starts sharing the query's
+        # first letter, with one edit distance row per start; a branch is
+        # dropped once every entry of its row is over max_edits. Matches
+        # are (distance, i, end) runs of keys in keys[i:end].
+        i = bisect_left(keys, (prefix,), lo)
+        while i < len(keys) and keys[i][0].startswith(prefix):
+            if len(keys[i][0]) == len(prefix):
+                # Whole keys shorter than the query; " " sorts after them
+                end = bisect_left(keys, (prefix + " ",), i)
+                if row[-1] <= max_edits:
+                    matches.append((row[-1], i, end))
+                i = end
+                continue
+            char = keys[i][0][len(prefix)]
+            start = prefix + char
+            # "~" sorts after every normalized character
+            end = bisect_left(keys, (start + "~",), i)
+            current = [len(start)] + [0] * len(query)
+            for j in range(1, len(query) + 1):
+                value = row[j - 1] + (char != query[j - 1])
+                if row[j] + 1 < value:
+                    value = row[j] + 1
+                if current[j - 1] + 1 < value:
+                    value = current[j - 1] + 1
+                if j > 1 and char == query[j - 2] and prefix[-1] == query[j - 1] and before[j - 2] + 1 < value:
+                    value = before[j - 2] + 1
+                current[j] = value
+            if len(start) == len(query):
+                if current[-1] <= max_edits:
+                    matches.append((current[-1], i, end))
+            elif min(current) <= max_edits:
+                NameIndex._walk_starts(keys, query, start, row, current, max_edits, i, matches)
+            i = end
+
+    @staticmethod
+    def _distance(query, name):
+        # Against the same-length start of each word-suffix, since the
+        # query is usually a name still being typed. Typos rarely hit the
+        # first letter, so other word-suffixes are skipped when any match it.
+        words = normalize(name).split()
+        keys = [" ".join(words[i:])[:len(query)] for i in range(len(words))]
+        keys = [key for key in keys if key[0] == query[0]] or keys
+        return min(edit_distance(query, key, FUZZY_MAX_EDITS) for key in keys)
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """Prefix matches, topped up with fuzzy matches, at most limit names."""
+        if not normalize(query):
+            with self._lock:
+                return list(islice(self._names, limit))
+        found = self.prefix(query, limit)
+        if len(found) < limit:
+            found += self.fuzzy(query, limit - len(found), exclude=set(found))
+        return found
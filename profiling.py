@@ -0,0 +1,104 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+# Recent durations kept per span for the percentiles
+METRICS_WINDOW = 1000
+PROFILE_LINES = 30
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+class Metrics:
+    """Timing spans for script reruns, shared by every session.
+
+    Spans opened between begin_rerun() and end_rerun() on a thread belong
+    to that rerun; each finished rerun is appended to log_path as one JSON
+    line with its total and per-span milliseconds. Reruns cut short by
+    st.rerun() or st.stop() are not logged, but their spans still count.
+    """
+
+    def __init__(self, log_path=None, window=METRICS_WINDOW):
+        self.log_path = log_path
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._samples = {}  # span -> recent milliseconds
+        self._totals = {}  # span -> [count, total milliseconds]
+        self._window = window
+
+    def record(self, name, ms):
+        with self._lock:
+            self._samples.setdefault(name, deque(maxlen=self._window)).append(ms)
+            totals = self._totals.setdefault(name, [0, 0.0])
+            totals[0] += 1
+            totals[1] += ms
+        spans = getattr(self._local, 'spans', None)
+        if spans is not None:
+            spans[name] = spans.get(name, 0.0) + ms
+
+    @contextmanager
+    def span(self, name):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - start) * 1000)
+
+    def begin_rerun(self):
+        self._local.start = time.perf_counter()
+        self._local.spans = {}
+
+    def end_rerun(self, **fields):
+        spans = getattr(self._local, 'spans', None)
+        if spans is None:
+            return
+        self._local.spans = None
+        ms = (time.perf_counter() - self._local.start) * 1000
+        self.record('rerun', ms)
+        if self.log_path:
+            record = dict(fields, at=time.time(), ms=round(ms, 3), spans={k: round(v, 3) for k, v in spans.items()})
+            with self._lock, open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record) + "\n")
+
+    def summary(self):
+        """Per-span count, recent p50/p99/max and total time, slowest total first."""
+        with self._lock:
+            stats = [(name, list(self._samples[name]), *self._totals[name]) for name in self._samples]
+        rows = [
+            {
+                'span': name,
+                'count': count,
+                'p50_ms': round(percentile(samples, 50), 2),
+                'p99_ms': round(percentile(samples, 99), 2),
+                'max_ms': round(max(samples), 2),
+                'total_s': round(total / 1000, 3),
+            }
+            for name, samples, count, total in stats
+        ]
+        return sorted(rows, key=lambda row: row['total_s'], reverse=True)
+
+
+def start_profile():
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def finish_profile(profiler, path=None, lines=PROFILE_LINES):
+    """Stop profiler, save its stats to path, and return the top functions by cumulative time."""
+    profiler.disable()
+    if path:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        profiler.dump_stats(path)
+    out = io.StringIO()
+    pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(lines)
+    return out.getvalue()
@@ -0,0 +1,68 @@
+import threading
+from bisect import bisect_right
+
+TOPIC_BUFFER_SIZE = 1000
+
+
+class Topic:
+    """Bounded, id-ordered message log that subscribers read by last-seen id."""
+
+    def __init__(self, capacity=TOPIC_BUFFER_SIZE):
+        self.capacity = capacity
+        self._ids = []
+        self._items = []
+        self._lock = threading.Lock()
+
+    @property
+    def latest_id(self):
+        # Read without the lock: a stale answer only delays delivery a tick
+        ids = self._ids
+        return ids[-1] if ids else 0
+
+    def publish(self, item_id, item):
+        with self._lock:
+            self._ids.append(item_id)
+            self._items.append(item)
+            if len(self._ids) > 2 * self.capacity:
+                # Trim in bulk so publishing stays amortised O(1)
+                del self._ids[:-self.capacity]
+                del self._items[:-self.capacity]
+
+    def since(self, last_seen_id):
+        """Items published after last_seen_id, oldest first.
+
+        Returns None when the subscriber has fallen behind the buffer and
+        must catch up from the backing store instead.
+        """
+        if last_seen_id >= self.latest_id:
+            return []
+        with self._lock:
+            if not self._ids or last_seen_id < self._ids[0] - 1:
+                return None
+            start = bisect_right(self._ids, last_seen_id)
+            return self._items[start:]
+
+
+class PubSub:
+    """In-process publish/subscribe over named topics."""
+
+    def __init__(self, capacity=TOPIC_BUFFER_SIZE):
+        self.capacity = capacity
+        self._topics = {}
+        self._lock = threading.Lock()
+
+    def topic(self, name):
+        topic = self._topics.get(name)
+        if topic is None:
+            with self._lock:
+                topic = self._topics.setdefault(name, Topic(self.capacity))
+        return topic
+
+    def publish(self, name, item_id, item):
+        self.topic(name).publish(item_id, item)
+
+    def latest_id(self, name):
+        return self.topic(name).latest_id
+
+    def since(self, name, last_seen_id):
+        return self.topic(name).since(last_seen_id)
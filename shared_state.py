@@ -0,0 +1,132 @@
+import threading
+from collections import defaultdict
+from datetime import datetime
+
+from analytics import SeasonAnalytics
+from event_engine import CatchRejected
+from leaderboard import Leaderboard
+from pubsub import PubSub
+
+
+class SharedState:
+    """Application state shared by every browser session in the process.
+
+    Each collection has its own lock, so registrations, event sign-ups and
+    catch submissions never block one another. Every write bumps a per-topic
+    version; readers compare versions (or wait on them) to learn about
+    changes without re-reading whole collections.
+    """
+
+    def __init__(self, users, catch_store, leaderboard, events, analytics=None):
+        self.users = users
+        self.catch_store = catch_store
+        self.leaderboard = leaderboard
+        self.analytics = analytics or SeasonAnalytics()
+        # An EventEngine: event dicts by name plus windows and check-ins
+        self.events = events
+        self._events_lock = threading.Lock()
+        self._catches_lock = threading.Lock()
+        self._versions = defaultdict(int)
+        self._changed = threading.Condition()
+        # New catches are also published here for live feed deltas
+        self.pubsub = PubSub()
+
+    def version(self, topic):
+        return self._versions[topic]
+
+    def _bump(self, topic):
+        with self._changed:
+            self._versions[topic] += 1
+            self._changed.notify_all()
+
+    def wait_for_change(self, topic, since_version, timeout=None):
+        """Block until topic moves past since_version; returns the new version."""
+        with self._changed:
+            self._changed.wait_for(lambda: self._versions[topic] != since_version, timeout)
+            return self._versions[topic]
+
+    def register_user(self, username, profile):
+        try:
+            self.users.add(username, profile)
+        except KeyError:
+            return False
+        self._bump('users')
+        return True
+
+    def captain_counties(self):
+        counties = {}
+        for username in self.users:
+            profile = self.users.get(username, {})
+            if profile.get('role') == "Captain":
+                counties[username] = profile.get('county')
+        return counties
+
+    def save_profile(self, username, changes):
+        if username not in self.users:
+            return False
+        self.users.update(username, changes)
+        self._bump('users')
+        return True
+
+    def check_in(self, event_name, username, day=None):
+        if not self.events.check_in(event_name, username, day):
+            return False
+        self._bump('checkins')
+        return True
+
+    def register_for_event(self, event_name, username):
+        with self._events_lock:
+            registered = self.events[event_name]['registered_users']
+            if username in registered:
+                return False
+            registered[username] = None
+            # The engine is the source of truth; profile['events'] is a copy for exports
+            if username in self.users:
+                events = self.users[username].get('events', [])
+                self.users.update(username, {'events': events + [event_name]})
+        self._bump('events')
+        return True
+
+    def submit_catch(self, catch, at=None):
+        """Store an accepted catch and update every view; returns its id.
+
+        Raises CatchRejected if the event's window is closed, the angler
+        hasn't checked in, or a value is out of range for the leaderboard.
+        """
+        error = self.events.catch_error(catch['event'], catch['angler'], at or datetime.now())
+        if error:
+            raise CatchRejected(error)
+        # Serialised so the store id order matches leaderboard/feed order
+        with self._catches_lock:
+            # Checked before the store write, so the store can't get ahead of
+            # the views (or hold a row the leaderboard can't load on restart)
+            try:
+                self.leaderboard.check(catch)
+            except ValueError as e:
+                raise CatchRejected(f"This catch can't be recorded: {e}") from None
+            catch['id'] = self.catch_store.add(catch)
+            self.leaderboard.add(catch)
+            self.analytics.add(catch, self.users.get(catch['captain'], {}).get('county'))
+            self.pubsub.publish('catches', catch['id'], dict(catch, disqualified=0))
+        self._bump('catches')
+        return catch['id']
+
+    def disqualify_catch(self, catch_id):
+        with self._catches_lock:
+            if not self.catch_store.disqualify(catch_id):
+                return False
+            self.leaderboard.disqualify(catch_id)
+            self.analytics.remove(catch_id)
+        self._bump('catches')
+        self._bump('corrections')
+        return True
+
+    def bulk_import(self, importer, *args):
+        """Run importer(catch_store, *args), then rebuild the derived views once."""
+        with self._catches_lock:
+            imported = importer(self.catch_store, *args)
+            self.leaderboard = Leaderboard.from_catches(self.catch_store.iter_catches())
+            self.analytics = SeasonAnalytics.from_store(self.catch_store, self.captain_counties())
+        self._bump('catches')
+        self._bump('corrections')
+        return imported
@@ -0,0 +1,126 @@
+import re
+import threading
+from bisect import bisect_left, insort
+from itertools import islice
+
+DIRECTORY_PAGE_SIZE = 20
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    return set(_TOKEN_RE.findall((text or "").lower()))
+
+
+class UserRepository:
+    """Registered users with secondary indexes by role, county and search token.
+
+    Profiles only change through add() and update(), which refresh the
+    index entries under the lock; sessions edit copies.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._users = {}
+        self._indexed = {}  # username -> (role, county, tokens)
+        # Dicts as insertion-ordered sets
+        self._by_role = {}
+        self._by_county = {}  # keyed by (role, county)
+        self._by_token = {}
+        self._tokens = []  # sorted, for prefix search
+
+    def __contains__(self, username):
+        return username in self._users
+
+    def __len__(self):
+        return len(self._users)
+
+    def __iter__(self):
+        with self._lock:
+            return iter(list(self._users))
+
+    def get(self, username, default=None):
+        return self._users.get(username, default)
+
+    def __getitem__(self, username):
+        return self._users[username]
+
+    def add(self, username, profile):
+        with self._lock:
+            if username in self._users:
+                raise KeyError(f"Username taken: {username}")
+            self._users[username] = profile
+            self._index(username)
+
+    def update(self, username, changes):
+        """Apply changes to a profile and re-index it."""
+        with self._lock:
+            self._unindex(username)
+            # A new dict, so readers holding the old one see it unchanged
+            self._users[username] = dict(self._users[username], **changes)
+            self._index(username)
+
+    def _index(self, username):
+        profile = self._users[username]
+        role, county = profile.get('role'), profile.get('county') or ""
+        tokens = tokenize(username) | tokenize(profile.get('bio'))
+        self._indexed[username] = (role, county, tokens)
+        self._by_role.setdefault(role, {})[username] = None
+        self._by_county.setdefault((role, county), {})[username] = None
+        for token in tokens:
+            users = self._by_token.get(token)
+            if users is None:
+                users = self._by_token[token] = {}
+                insort(self._tokens, token)
+            users[username] = None
+
+    def _unindex(self, username):
+        role, county, tokens = self._indexed.pop(username)
+        del self._by_role[role][username]
+        del self._by_county[(role, county)][username]
+        for token in tokens:
+            users = self._by_token[token]
+            del users[username]
+            if not users:
+                del self._by_token[token]
+                del self._tokens[bisect_left(self._tokens, token)]
+
+    def _prefix_matches(self, prefix):
+        matches = {}
+        i = bisect_left(self._tokens, prefix)
+        while i < len(self._tokens) and self._tokens[i].startswith(prefix):
+            matches.update(self._by_token[self._tokens[i]])
+            i += 1
+        return matches
+
+    def search(self, query):
+        """Usernames whose name or bio has a word starting with every query term."""
+        terms = sorted(tokenize(query), key=len, reverse=True)
+        if not terms:
+            return []
+        with self._lock:
+            # Longest terms first: they usually match the fewest users
+            result = self._prefix_matches(terms[0])
+            for term in terms[1:]:
+                if not result:
+                    break
+                other = self._prefix_matches(term)
+                result = {u: None for u in result if u in other}
+            return list(result)
+
+    def directory(self, role, county=None, query="", page=0, page_size=DIRECTORY_PAGE_SIZE):
+        """One page of (username, profile) pairs plus the total match count."""
+        with self._lock:
+            if county:
+                base = self._by_county.get((role, county), {})
+            else:
+                base = self._by_role.get(role, {})
+            if query:
+                usernames = [u for u in self.search(query) if u in base]
+            else:
+                usernames = base
+            start = page * page_size
+            return (
+                [(u, self._users[u]) for u in islice(usernames, start, start + page_size)],
+                len(usernames),
+            )